@@ -5,25 +5,41 @@ Standalone script to run Storm without installation
 
 import sys
 import os
-import colorama
-from colorama import Fore, Style
-
-# Initialize colorama
-colorama.init()
-
-# Print a nice banner
-print(rf"""
-{Fore.CYAN}╔═══════════════════════════════════════════════════════════╗
-║ {Fore.YELLOW}  _____ _______ ____  _____  __  __ {Fore.CYAN}                      ║
-║ {Fore.YELLOW} / ____|__   __/ __ \|  __ \|  \/  |{Fore.CYAN}                      ║
-║ {Fore.YELLOW}| (___    | | | |  | | |__) | \  / |{Fore.CYAN}                      ║
-║ {Fore.YELLOW} \___ \   | | | |  | |  _  /| |\/| |{Fore.CYAN}                      ║
-║ {Fore.YELLOW} ____) |  | | | |__| | | \ \| |  | |{Fore.CYAN}                      ║
-║ {Fore.YELLOW}|_____/   |_|  \____/|_|  \_\_|  |_|{Fore.CYAN}                      ║
+
+# Startup banner, with the ANSI color codes spelled out so it is a plain constant
+_BANNER = """
+\x1b[36m╔═══════════════════════════════════════════════════════════╗
+║ \x1b[33m  _____ _______ ____  _____  __  __ \x1b[36m                      ║
+║ \x1b[33m / ____|__   __/ __ \\|  __ \\|  \\/  |\x1b[36m                      ║
+║ \x1b[33m| (___    | | | |  | | |__) | \\  / |\x1b[36m                      ║
+║ \x1b[33m \\___ \\   | | | |  | |  _  /| |\\/| |\x1b[36m                      ║
+║ \x1b[33m ____) |  | | | |__| | | \\ \\| |  | |\x1b[36m                      ║
+║ \x1b[33m|_____/   |_|  \\____/|_|  \\_\\_|  |_|\x1b[36m                      ║
 ║                                                           ║
-║ {Fore.GREEN}RPC Flood Testing Tool{Fore.CYAN}                                    ║
-╚═══════════════════════════════════════════════════════════╝{Style.RESET_ALL}
-""")
+║ \x1b[32mRPC Flood Testing Tool\x1b[36m                                    ║
+╚═══════════════════════════════════════════════════════════╝\x1b[0m
+
+"""
+
+# Color codes are only written to a terminal
+_USE_COLOR = sys.stdout.isatty()
+
+def _colored(text: str, color: str) -> str:
+    """Wrap text in an ANSI color code when writing to a terminal"""
+    return f"{color}{text}\x1b[0m" if _USE_COLOR else text
+
+if _USE_COLOR:
+    # Only legacy Windows consoles need colorama to translate ANSI escapes,
+    # POSIX terminals and Windows Terminal understand them natively
+    if sys.platform == "win32" and not os.environ.get("WT_SESSION"):
+        import colorama
+        colorama.init()
+    
+    # Print a nice banner
+    sys.stdout.write(_BANNER)
+else:
+    # Keep piped output and CI logs free of escape codes and box drawing
+    print("Storm - RPC Flood Testing Tool")
 
 # Add the current directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
@@ -35,7 +51,10 @@ if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        print(f"\n{Fore.YELLOW}Storm testing stopped by user.{Style.RESET_ALL}")
+        print("\n" + _colored("Storm testing stopped by user.", "\x1b[33m"))
+        # Skip interpreter teardown, which can block on finalizers for in-flight sockets
+        sys.stdout.flush()
+        os._exit(130)
     except Exception as e:
-        print(f"\n{Fore.RED}Error: {str(e)}{Style.RESET_ALL}")
+        print("\n" + _colored(f"Error: {str(e)}", "\x1b[31m"))
         sys.exit(1) 
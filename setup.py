@@ -9,7 +9,20 @@ setup(
     install_requires=[
         "aiohttp>=3.8.0",
         "asyncio>=3.4.3",
+        "colorama>=0.4.4",
+        "multidict>=4.5",
+        "tqdm>=4.62.0",
     ],
+    extras_require={
+        "fast": [
+            "uvloop>=0.19; sys_platform != 'win32'",
+            "aiodns>=3.0",
+            "orjson>=3.9",
+        ],
+        "http2": [
+            "httpx[http2]>=0.24",
+        ],
+    },
     entry_points={
         "console_scripts": [
             "storm=storm.__main__:main",
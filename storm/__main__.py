@@ -3,30 +3,88 @@
 Main module for Storm
 """
 
-import argparse
 import asyncio
+import contextlib
+import os
+import signal
 import sys
-from typing import List, Optional
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Dict, List, Optional, Tuple
 
-from storm.ethereum import RPCFloodTester
-from storm.abci import ABCIFloodTester
-from storm.abci_query_fuzzer import ABCIQueryFuzzer
+# The tester modules, aiohttp and argparse are imported lazily when needed
+if TYPE_CHECKING:
+    import argparse
+    import aiohttp
 
-async def run_ethereum_test(url: str, requests_per_second: int = 100, duration: int = 60, methods: Optional[List[str]] = None, verbose: bool = False):
+try:
+    import uvloop
+except ImportError:
+    # uvloop is optional (and unavailable on Windows), fall back to the default loop
+    uvloop = None
+
+# Separates subcommands that should run concurrently in one process
+COMMAND_SEPARATOR = "+"
+
+def _create_session(requests_per_second: int) -> "aiohttp.ClientSession":
+    """
+    Create the session shared by all testers of a run
+    """
+    from storm.session import create_session
+    
+    return create_session(requests_per_second)
+
+@contextlib.asynccontextmanager
+async def _session_scope(session: Optional["aiohttp.ClientSession"], requests_per_second: int) -> AsyncIterator["aiohttp.ClientSession"]:
+    """
+    Yield the given shared session, or a new one that is closed afterwards
+    """
+    if session is not None:
+        yield session
+    else:
+        async with _create_session(requests_per_second) as session:
+            yield session
+
+async def run_ethereum_test(url: str, requests_per_second: int = 100, duration: int = 60, methods: Optional[List[str]] = None, verbose: bool = False,
+                            batch_size: int = 1, log_interval: float = 1.0, workers: Optional[int] = None,
+                            session: Optional["aiohttp.ClientSession"] = None):
     """
     Run Ethereum RPC flood testing
+    
+    Verbose output is buffered by the tester and printed every log_interval
+    seconds; running under python -O strips it from the request path entirely.
     """
-    tester = RPCFloodTester(url, requests_per_second, methods, verbose)
-    await tester.run(duration)
+    from storm.ethereum import RPCFloodTester
+    
+    async with _session_scope(session, requests_per_second) as session:
+        tester = RPCFloodTester(url, requests_per_second, methods, verbose, session=session, batch_size=batch_size,
+                                log_interval=log_interval, workers=workers)
+        await tester.run(duration)
 
-async def run_abci_test(url: str, requests_per_second: int = 100, duration: int = 60, methods: Optional[List[str]] = None, verbose: bool = False):
+async def run_abci_test(url: str, requests_per_second: int = 100, duration: int = 60, methods: Optional[List[str]] = None, verbose: bool = False,
+                        log_interval: float = 1.0, workers: Optional[int] = None, http2: bool = False, batch_size: int = 1,
+                        session: Optional["aiohttp.ClientSession"] = None):
     """
     Run ABCI RPC flood testing
+    
+    Verbose output is buffered by the tester and printed every log_interval
+    seconds; running under python -O strips it from the request path entirely.
+    With http2, the test uses its own HTTP/2 session instead of a shared one.
     """
-    tester = ABCIFloodTester(url, requests_per_second, methods, verbose)
-    await tester.run(duration)
+    from storm.abci import ABCIFloodTester
+    
+    if http2:
+        from storm.session import create_http2_session
+        session_scope = create_http2_session(requests_per_second)
+    else:
+        session_scope = _session_scope(session, requests_per_second)
+    
+    async with session_scope as session:
+        tester = ABCIFloodTester(url, requests_per_second, methods, verbose, session=session,
+                                 log_interval=log_interval, workers=workers, batch_size=batch_size)
+        await tester.run(duration)
 
-async def run_abci_query_fuzzer(url: str, max_attempts: int = 1000, actor_address: Optional[str] = None, verbose: bool = False):
+async def run_abci_query_fuzzer(url: str, max_attempts: int = 1000, actor_address: Optional[str] = None, verbose: bool = False,
+                                concurrency: int = 50, batch_size: int = 10, session: Optional["aiohttp.ClientSession"] = None):
     """
     Run ABCI query path discovery
     
@@ -35,51 +93,276 @@ async def run_abci_query_fuzzer(url: str, max_attempts: int = 1000, actor_addres
         max_attempts: Maximum number of query attempts
         actor_address: Optional known actor address to use in queries
         verbose: Whether to print verbose output
+        concurrency: Maximum number of HTTP requests in flight at once
+        batch_size: Number of queries sent per JSON-RPC batch request
+        session: Optional shared aiohttp session
     """
-    fuzzer = ABCIQueryFuzzer(url, verbose=verbose, actor_address=actor_address)
+    from storm.abci_query_fuzzer import ABCIQueryFuzzer
+    
+    fuzzer = ABCIQueryFuzzer(url, verbose=verbose, actor_address=actor_address, session=session,
+                           concurrency=concurrency, batch_size=batch_size)
     await fuzzer.discover_working_paths(max_attempts)
 
-def main():
+def _command_coroutine(args: "argparse.Namespace", session: Optional["aiohttp.ClientSession"] = None) -> Awaitable[None]:
     """
-    Main entry point for Storm
+    Create the coroutine that runs a parsed subcommand
+    """
+    if args.command == "eth":
+        return run_ethereum_test(args.url, args.requests_per_second, args.duration, args.methods, args.verbose, args.batch_size,
+                                 args.log_interval, args.workers, session=session)
+    elif args.command == "abci":
+        return run_abci_test(args.url, args.requests_per_second, args.duration, args.methods, args.verbose,
+                             args.log_interval, args.workers, args.http2, args.batch_size, session=session)
+    else:
+        return run_abci_query_fuzzer(args.url, args.attempts, args.actor, args.verbose, args.concurrency, args.batch_size,
+                                     session=session)
+
+async def run_combined(commands: List["argparse.Namespace"]):
+    """
+    Run several subcommands concurrently on one event loop and one session
+    
+    Args:
+        commands: Parsed arguments for each subcommand
+    """
+    requests_per_second = sum(getattr(args, "requests_per_second", 0) for args in commands)
+    async with _create_session(requests_per_second) as session:
+        await asyncio.gather(*(_command_coroutine(args, session) for args in commands))
+
+async def _run_until_interrupted(coro: Awaitable[None]):
+    """
+    Run a command, cancelling it on the first Ctrl+C and exiting hard on the second
+    
+    A flood test that is cancelled while it runs stops sending, waits for
+    the requests in flight and still prints its report. A second Ctrl+C
+    skips waiting for in-flight requests altogether.
+    """
+    loop = asyncio.get_running_loop()
+    task = asyncio.ensure_future(coro)
+    interrupted = False
+    
+    def on_interrupt():
+        nonlocal interrupted
+        if interrupted:
+            sys.stdout.flush()
+            os._exit(130)
+        interrupted = True
+        task.cancel()
+    
+    try:
+        loop.add_signal_handler(signal.SIGINT, on_interrupt)
+    except (NotImplementedError, RuntimeError):
+        # Not supported by the Windows event loops, keep the default behaviour
+        await task
+        return
+    
+    try:
+        await task
+    except asyncio.CancelledError:
+        if interrupted:
+            raise KeyboardInterrupt
+        raise
+    finally:
+        loop.remove_signal_handler(signal.SIGINT)
+
+def _run(coro: Awaitable[None]):
     """
-    parser = argparse.ArgumentParser(description="Storm - RPC Flood Testing Tool")
+    Run a coroutine to completion on a new event loop with debug checks turned off
+    
+    Unlike asyncio.run, the loop never enables debug mode (e.g. via
+    PYTHONASYNCIODEBUG or -X dev), which would time every callback.
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    loop.set_debug(False)
+    loop.slow_callback_duration = 86400.0
+    try:
+        loop.run_until_complete(coro)
+    finally:
+        try:
+            # Cancel whatever is left over, e.g. after an interrupt
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+def _split_commands(argv: List[str]) -> List[List[str]]:
+    """
+    Split the command line into subcommands separated by a standalone "+"
+    """
+    commands = [[]]
+    for arg in argv:
+        if arg == COMMAND_SEPARATOR:
+            commands.append([])
+        else:
+            commands[-1].append(arg)
+    return commands
+
+# Options understood by the fast command line parser, per subcommand:
+# flag -> (destination, type), where type None is a store_true flag and list takes one or more values
+_FLOOD_OPTIONS = {
+    "-r": ("requests_per_second", int), "--requests-per-second": ("requests_per_second", int),
+    "-d": ("duration", int), "--duration": ("duration", int),
+    "-m": ("methods", list), "--methods": ("methods", list),
+    "-v": ("verbose", None), "--verbose": ("verbose", None),
+    "--log-interval": ("log_interval", float),
+    "--no-uvloop": ("no_uvloop", None),
+    "-b": ("batch_size", int), "--batch-size": ("batch_size", int),
+    "-w": ("workers", int), "--workers": ("workers", int),
+}
+_FAST_COMMANDS: Dict[str, Tuple[Dict[str, tuple], Dict[str, object]]] = {
+    "eth": (
+        _FLOOD_OPTIONS,
+        {"requests_per_second": 100, "duration": 60, "methods": None, "verbose": False, "log_interval": 1.0, "no_uvloop": False, "batch_size": 1,
+         "workers": None},
+    ),
+    "abci": (
+        {**_FLOOD_OPTIONS, "--http2": ("http2", None)},
+        {"requests_per_second": 100, "duration": 60, "methods": None, "verbose": False, "log_interval": 1.0, "no_uvloop": False, "batch_size": 1,
+         "workers": None, "http2": False},
+    ),
+    "abci-query": (
+        {"-a": ("attempts", int), "--attempts": ("attempts", int), "--actor": ("actor", str),
+         "-c": ("concurrency", int), "--concurrency": ("concurrency", int),
+         "-b": ("batch_size", int), "--batch-size": ("batch_size", int),
+         "-v": ("verbose", None), "--verbose": ("verbose", None)},
+        {"attempts": 1000, "actor": None, "concurrency": 50, "batch_size": 10, "verbose": False},
+    ),
+}
+
+def _fast_parse(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse a well-formed subcommand without importing argparse
+    
+    Returns None for anything it does not fully understand (help, unknown
+    options, bad values, ...) so that argparse can handle it and report errors.
+    """
+    if not argv or argv[0] not in _FAST_COMMANDS:
+        return None
+    options, defaults = _FAST_COMMANDS[argv[0]]
+    values = dict(defaults, command=argv[0])
+    positionals = []
+    
+    i = 1
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+        if not arg.startswith("-"):
+            positionals.append(arg)
+            continue
+        if arg not in options:
+            return None
+        dest, kind = options[arg]
+        if kind is None:
+            values[dest] = True
+        elif kind is list:
+            items = []
+            while i < len(argv) and not argv[i].startswith("-"):
+                items.append(argv[i])
+                i += 1
+            if not items:
+                return None
+            values[dest] = items
+        else:
+            if i >= len(argv):
+                return None
+            try:
+                values[dest] = kind(argv[i])
+            except ValueError:
+                return None
+            i += 1
+    
+    if len(positionals) != 1:
+        return None
+    values["url"] = positionals[0]
+    return SimpleNamespace(**values)
+
+def _build_parser() -> "argparse.ArgumentParser":
+    """
+    Build the command line parser for all Storm subcommands
+    """
+    import argparse
+    
+    # Options shared by the flood testing subcommands
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("-r", "--requests-per-second", type=int, default=100, help="Number of requests per second")
+    common.add_argument("-d", "--duration", type=int, default=60, help="Duration of the test in seconds")
+    common.add_argument("-m", "--methods", nargs="+", help="Methods to test (default: all)")
+    common.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
+    common.add_argument("--log-interval", type=float, default=1.0, help="Seconds between flushes of verbose output")
+    common.add_argument("--no-uvloop", action="store_true", help="Use the default asyncio event loop even if uvloop is installed")
+    common.add_argument("-b", "--batch-size", type=int, default=1, help="Number of JSON-RPC calls sent per HTTP request")
+    common.add_argument("-w", "--workers", type=int, help="Number of concurrent request workers (default: requests per second / batch size)")
+    
+    parser = argparse.ArgumentParser(
+        description="Storm - RPC Flood Testing Tool",
+        epilog=f"Several subcommands can be run concurrently by separating them with '{COMMAND_SEPARATOR}', "
+               f"e.g. eth http://localhost:8545 {COMMAND_SEPARATOR} abci http://localhost:26657",
+    )
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
     
     # Ethereum subcommand
-    eth_parser = subparsers.add_parser("eth", help="Run Ethereum RPC flood testing")
+    eth_parser = subparsers.add_parser("eth", parents=[common], help="Run Ethereum RPC flood testing")
     eth_parser.add_argument("url", help="URL of the Ethereum JSON-RPC API")
-    eth_parser.add_argument("-r", "--requests-per-second", type=int, default=100, help="Number of requests per second")
-    eth_parser.add_argument("-d", "--duration", type=int, default=60, help="Duration of the test in seconds")
-    eth_parser.add_argument("-m", "--methods", nargs="+", help="Methods to test (default: all)")
-    eth_parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
     
     # ABCI subcommand
-    abci_parser = subparsers.add_parser("abci", help="Run ABCI RPC flood testing")
+    abci_parser = subparsers.add_parser("abci", parents=[common], help="Run ABCI RPC flood testing")
     abci_parser.add_argument("url", help="URL of the ABCI RPC endpoint")
-    abci_parser.add_argument("-r", "--requests-per-second", type=int, default=100, help="Number of requests per second")
-    abci_parser.add_argument("-d", "--duration", type=int, default=60, help="Duration of the test in seconds")
-    abci_parser.add_argument("-m", "--methods", nargs="+", help="Methods to test (default: all)")
-    abci_parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
+    abci_parser.add_argument("--http2", action="store_true", help="Multiplex requests over HTTP/2 (https endpoints, requires httpx)")
     
     # ABCI Query Fuzzer subcommand
     abci_query_parser = subparsers.add_parser("abci-query", help="Run ABCI query path discovery")
     abci_query_parser.add_argument("url", help="URL of the ABCI RPC endpoint")
     abci_query_parser.add_argument("-a", "--attempts", type=int, default=1000, help="Maximum number of query attempts")
     abci_query_parser.add_argument("--actor", help="Known actor address to use in queries")
+    abci_query_parser.add_argument("-c", "--concurrency", type=int, default=50, help="Maximum number of requests in flight at once")
+    abci_query_parser.add_argument("-b", "--batch-size", type=int, default=10, help="Number of queries sent per JSON-RPC batch request")
     abci_query_parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
     
-    args = parser.parse_args()
+    return parser
+
+# Built on first use and reused by later main() calls in the same interpreter
+_PARSER: Optional["argparse.ArgumentParser"] = None
+
+def _get_parser() -> "argparse.ArgumentParser":
+    """
+    Return the cached command line parser, building it on first use
+    """
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
+def _parse_command(argv: List[str]) -> "argparse.Namespace":
+    """
+    Parse one subcommand, only falling back to argparse when the fast parser gives up
+    """
+    args = _fast_parse(argv)
+    if args is None:
+        args = _get_parser().parse_args(argv)
+    return args
+
+def main():
+    """
+    Main entry point for Storm
+    """
+    commands = [_parse_command(argv) for argv in _split_commands(sys.argv[1:])]
     
-    if args.command == "eth":
-        asyncio.run(run_ethereum_test(args.url, args.requests_per_second, args.duration, args.methods, args.verbose))
-    elif args.command == "abci":
-        asyncio.run(run_abci_test(args.url, args.requests_per_second, args.duration, args.methods, args.verbose))
-    elif args.command == "abci-query":
-        asyncio.run(run_abci_query_fuzzer(args.url, args.attempts, args.actor, args.verbose))
-    else:
-        parser.print_help()
+    if any(args.command is None for args in commands):
+        _get_parser().print_help()
         sys.exit(1)
+    
+    # Use the libuv-based event loop for all testers when available, unless any command opts out
+    if uvloop is not None and not any(getattr(args, "no_uvloop", False) for args in commands):
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
+    if len(commands) == 1:
+        _run(_run_until_interrupted(_command_coroutine(commands[0])))
+    else:
+        _run(_run_until_interrupted(run_combined(commands)))
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -3,29 +3,65 @@ ABCI RPC flood testing module for Storm
 """
 
 import asyncio
+from collections import Counter
 import json
+from array import array
 import random
 import time
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import Dict, List, Any, Optional, Tuple, Union
 import aiohttp
-import uuid
-import colorama
 from colorama import Fore, Style
-from tqdm import tqdm
 import os
 import base64
 from datetime import datetime
 import sys
+from . import json_utils
+from .console import init_colors
+from .failure_log import FailureLog
+from .log_buffer import LogBuffer
+from .progress import ProgressTicker
+from .rate_limiter import TokenBucket
+from .session import create_session
 
-# Initialize colorama
-colorama.init()
+# JSON-RPC request body prefix and suffix, the method name is filled in once per method
+_REQUEST_PREFIX = b'{"jsonrpc":"2.0","id":%d,"method":'
+_REQUEST_SUFFIX = b',"params":%b}'
+
+# Prefixes of verbose request and response messages, which are buffered as bytes
+_VERBOSE_REQUEST = f"{Fore.GREEN}Request: ".encode()
+_VERBOSE_RESPONSE = f"{Fore.GREEN}Response: ".encode()
+_VERBOSE_RESET = Style.RESET_ALL.encode()
+
+# Params of the methods that take none, shared by all calls and never modified,
+# and their serialized form
+_NO_PARAMS: List[Any] = []
+_EMPTY_PARAMS = b"[]"
+
+# Serialized params of the methods whose only param has a small range, picked whole per request
+_HEIGHT_PARAMS = tuple(b'{"height":"%d"}' % height for height in range(1, 1001))
+_UNCONFIRMED_TXS_PARAMS = tuple(b'{"limit":"%d"}' % limit for limit in range(10, 101))
+
+# Paths of abci_query requests
+_QUERY_PATHS = ("/store/acc/key", "/store/staking/key", "/custom/gov/proposals")
+_QUERY_PATHS_JSON = tuple(json_utils.dumps(path) for path in _QUERY_PATHS)
+
+# Serialized booleans, indexed by a random bit
+_BOOL_JSON = (b"false", b"true")
+
+# Number of pre-generated random payloads for parameters that do not need to be unique
+RANDOM_POOL_SIZE = 4096
+
+# Size of the random byte buffer that broadcast txs are sliced from
+RANDOM_BYTES_SIZE = 1 << 20
 
 class ABCIFloodTester:
     """
     ABCI RPC flood testing implementation
     """
     
-    def __init__(self, url: str, requests_per_second: int = 100, methods: Optional[List[str]] = None, verbose: bool = False):
+    def __init__(self, url: str, requests_per_second: int = 100, methods: Optional[List[str]] = None, verbose: bool = False,
+                 session: Optional[aiohttp.ClientSession] = None, rate_limiter: Optional[TokenBucket] = None,
+                 log_interval: float = 1.0, workers: Optional[int] = None, batch_size: int = 1):
         """
         Initialize the ABCI RPC flood tester
         
@@ -34,11 +70,22 @@ class ABCIFloodTester:
             requests_per_second: Number of requests per second to send
             methods: List of methods to test (default: all)
             verbose: Whether to print verbose output
+            session: Optional shared aiohttp session (closed by the caller)
+            rate_limiter: Optional shared token bucket pacing the requests,
+                otherwise the tester creates its own
+            log_interval: Seconds between flushes of buffered verbose output
+            workers: Number of concurrent request workers (default: requests_per_second / batch_size)
+            batch_size: Number of JSON-RPC calls sent per HTTP request
         """
         self.url = url
         self.requests_per_second = requests_per_second
         self.verbose = verbose
-        self.session = None
+        self.verbose_log = LogBuffer(log_interval)
+        self.session = session
+        self._owns_session = session is None
+        self.rate_limiter = rate_limiter
+        self.batch_size = max(1, batch_size)
+        self.workers = max(1, workers if workers is not None else -(-requests_per_second // self.batch_size))
         self.request_id = 0
         
         # Define all available ABCI methods - use Tendermint RPC methods instead
@@ -77,8 +124,8 @@ class ABCIFloodTester:
             "total_requests": 0,
             "successful_requests": 0,
             "failed_requests": 0,
-            "requests_by_method": {},
-            "errors_by_method": {},
+            "requests_by_method": Counter(),
+            "errors_by_method": Counter(),
             "min_response_time": float('inf'),
             "max_response_time": 0,
             "total_response_time": 0,
@@ -87,6 +134,9 @@ class ABCIFloodTester:
             "available_methods": set()
         }
         
+        # Response times in nanoseconds, summarized into the stats when the run ends
+        self.response_times = array("q")
+        
         # Initialize request counters for each method
         for method in self.all_methods:
             self.stats["requests_by_method"][method] = 0
@@ -115,17 +165,66 @@ class ABCIFloodTester:
             "unconfirmed_txs": self._generate_unconfirmed_txs_params
         }
         
-        # Create log directory if it doesn't exist
-        os.makedirs("logs", exist_ok=True)
+        # Request templates per method, only the id and the params are formatted in per request
+        self._request_templates = {
+            method: _REQUEST_PREFIX + json_utils.dumps(method) + _REQUEST_SUFFIX for method in self.all_methods
+        }
         
-        # Create a log file for failed requests
+        # Params of every method formatted straight to bytes, a method without an
+        # encoder raises KeyError when its request is encoded
+        self.param_encoders = {
+            "abci_info": self._encode_empty_params,
+            "broadcast_tx_sync": self._encode_broadcast_tx_params,
+            "broadcast_tx_async": self._encode_broadcast_tx_params,
+            "broadcast_tx_commit": self._encode_broadcast_tx_params,
+            "block": self._encode_height_params,
+            "block_results": self._encode_height_params,
+            "blockchain": self._encode_blockchain_params,
+            "consensus_state": self._encode_empty_params,
+            "status": self._encode_empty_params,
+            "net_info": self._encode_empty_params,
+            "validators": self._encode_validators_params,
+            "health": self._encode_empty_params,
+            "commit": self._encode_height_params,
+            "abci_query": self._encode_abci_query_params,
+            "tx": self._encode_tx_params,
+            "tx_search": self._encode_tx_search_params,
+            "genesis": self._encode_empty_params,
+            "num_unconfirmed_txs": self._encode_empty_params,
+            "unconfirmed_txs": self._encode_unconfirmed_txs_params
+        }
+        
+        # Pools of random query data and tx hashes, so lookups do not call os.urandom per request
+        # The data lengths are drawn in one random.choices call rather than a randint per entry
+        self._query_data_pool = [
+            base64.b64encode(os.urandom(length)).decode('ascii')
+            for length in random.choices(range(1, 33), k=RANDOM_POOL_SIZE)
+        ]
+        self._tx_hash_pool = [base64.b64encode(os.urandom(32)).decode('ascii') for _ in range(RANDOM_POOL_SIZE)]
+        # Their serialized forms, for the encoders
+        self._query_data_json = [json_utils.dumps(data) for data in self._query_data_pool]
+        self._tx_hash_json = [json_utils.dumps(tx_hash) for tx_hash in self._tx_hash_pool]
+        
+        # Broadcast txs are random slices of one buffer, a fixed pool of txs would mostly be
+        # rejected by the node's mempool cache as duplicates
+        self._random_bytes = os.urandom(RANDOM_BYTES_SIZE)
+        
+        # Log file for failed requests, created when the test runs
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.log_file = f"logs/abci_failed_requests_{timestamp}.log"
         
+        # Failed requests are appended by a background writer, see FailureLog
+        self.failure_log = FailureLog(self.log_file)
+    
+    def _ensure_log_file(self):
+        """Create the log file for failed requests and write its header"""
+        # Create log directory if it doesn't exist
+        os.makedirs("logs", exist_ok=True)
+        
         # Log file header
         with open(self.log_file, "w") as f:
             f.write(f"# ABCI RPC Failed Requests Log\n")
-            f.write(f"# Target: {url}\n")
+            f.write(f"# Target: {self.url}\n")
             f.write(f"# Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
             f.write(f"# Methods: {', '.join(self.methods)}\n")
             f.write(f"# Format: [timestamp] method | request | response/error\n\n")
@@ -133,11 +232,12 @@ class ABCIFloodTester:
     async def _create_session(self):
         """Create an aiohttp session"""
         if self.session is None:
-            self.session = aiohttp.ClientSession()
+            self.session = create_session(self.requests_per_second)
     
     async def _close_session(self):
-        """Close the aiohttp session"""
-        if self.session:
+        """Write out the remaining failed requests and close the aiohttp session"""
+        await self.failure_log.stop()
+        if self.session and self._owns_session:
             await self.session.close()
             self.session = None
     
@@ -162,7 +262,7 @@ class ABCIFloodTester:
                 "params": {"message": "Storm ABCI Test"}
             }
             
-            async with self.session.post(self.url, json=request, timeout=5) as response:
+            async with self.session.post(self.url, data=json_utils.dumps(request), headers=json_utils.JSON_HEADERS, timeout=5) as response:
                 return response.status == 200
         except Exception as e:
             if self.verbose:
@@ -176,11 +276,9 @@ class ABCIFloodTester:
         Returns:
             Dict[str, bool]: Dictionary of method availability
         """
-        available_methods = {}
-        
         print(f"{Fore.CYAN}Checking method availability...{Style.RESET_ALL}")
         
-        for method in self.methods:
+        async def probe(method: str) -> Tuple[str, bool, Optional[str]]:
             try:
                 params = self.param_generators[method]()
                 request = {
@@ -190,20 +288,28 @@ class ABCIFloodTester:
                     "params": params
                 }
                 
-                async with self.session.post(self.url, json=request, timeout=5) as response:
-                    available = response.status == 200
-                    available_methods[method] = available
-                    
-                    status_color = Fore.GREEN if available else Fore.RED
-                    status_text = "Available" if available else "Not Available"
-                    print(f"  {Fore.CYAN}{method}:{Style.RESET_ALL} {status_color}{status_text}{Style.RESET_ALL}")
-                    
-                    if available:
-                        self.stats["available_methods"].add(method)
-            
+                async with self.session.post(self.url, data=json_utils.dumps(request), headers=json_utils.JSON_HEADERS, timeout=5) as response:
+                    return method, response.status == 200, None
             except Exception as e:
-                available_methods[method] = False
-                print(f"  {Fore.CYAN}{method}:{Style.RESET_ALL} {Fore.RED}Error: {str(e)}{Style.RESET_ALL}")
+                return method, False, str(e)
+        
+        # Probe all methods at once, results come back in the order of self.methods
+        results = await asyncio.gather(*(probe(method) for method in self.methods))
+        
+        available_methods = {}
+        for method, available, error in results:
+            available_methods[method] = available
+            
+            if error is not None:
+                print(f"  {Fore.CYAN}{method}:{Style.RESET_ALL} {Fore.RED}Error: {error}{Style.RESET_ALL}")
+                continue
+            
+            status_color = Fore.GREEN if available else Fore.RED
+            status_text = "Available" if available else "Not Available"
+            print(f"  {Fore.CYAN}{method}:{Style.RESET_ALL} {status_color}{status_text}{Style.RESET_ALL}")
+            
+            if available:
+                self.stats["available_methods"].add(method)
         
         return available_methods
     
@@ -216,26 +322,31 @@ class ABCIFloodTester:
         }
     
     def _generate_empty_params(self) -> List[Any]:
-        """Generate empty parameters"""
-        return []
+        """Generate empty parameters, the list is shared"""
+        return _NO_PARAMS
     
     def _generate_abci_info_params(self) -> List[Any]:
-        """Generate parameters for abci_info"""
-        return []
+        """Generate parameters for abci_info, the list is shared"""
+        return _NO_PARAMS
     
     def _generate_abci_query_params(self) -> Dict[str, Any]:
         """Generate parameters for abci_query"""
         return {
-            "path": random.choice(["/store/acc/key", "/store/staking/key", "/custom/gov/proposals"]),
-            "data": base64.b64encode(os.urandom(random.randint(1, 32))).decode('utf-8'),
+            "path": random.choice(_QUERY_PATHS),
+            "data": random.choice(self._query_data_pool),
             "height": str(random.randint(1, 1000)),
-            "prove": random.choice([True, False])
+            "prove": bool(random.getrandbits(1))
         }
     
+    def _get_random_bytes(self, length: int) -> bytes:
+        """Get a random slice of the pre-generated random bytes"""
+        offset = random.randrange(RANDOM_BYTES_SIZE - length)
+        return self._random_bytes[offset:offset + length]
+    
     def _generate_broadcast_tx_params(self) -> Dict[str, Any]:
         """Generate parameters for broadcast_tx methods"""
         return {
-            "tx": base64.b64encode(os.urandom(random.randint(32, 128))).decode('utf-8')
+            "tx": base64.b64encode(self._get_random_bytes(random.randint(32, 128))).decode('ascii')
         }
     
     def _generate_block_params(self) -> Dict[str, Any]:
@@ -264,18 +375,20 @@ class ABCIFloodTester:
     def _generate_tx_params(self) -> Dict[str, Any]:
         """Generate parameters for tx"""
         return {
-            "hash": base64.b64encode(os.urandom(32)).decode('utf-8'),
-            "prove": random.choice([True, False])
+            "hash": random.choice(self._tx_hash_pool),
+            "prove": bool(random.getrandbits(1))
         }
     
     def _generate_tx_search_params(self) -> Dict[str, Any]:
         """Generate parameters for tx_search"""
+        # prove and order_by are decided by one bit each of a single draw
+        flips = random.getrandbits(2)
         return {
             "query": f"tx.height={random.randint(1, 1000)}",
-            "prove": random.choice([True, False]),
+            "prove": bool(flips & 1),
             "page": str(random.randint(1, 5)),
             "per_page": str(random.randint(10, 100)),
-            "order_by": random.choice(["asc", "desc"])
+            "order_by": "desc" if flips & 2 else "asc"
         }
     
     def _generate_commit_params(self) -> Dict[str, Any]:
@@ -290,7 +403,58 @@ class ABCIFloodTester:
             "limit": str(random.randint(10, 100))
         }
     
-    async def _send_request(self, method: str) -> Tuple[bool, float]:
+    def _encode_empty_params(self) -> bytes:
+        """Encode empty parameters"""
+        return _EMPTY_PARAMS
+    
+    def _encode_broadcast_tx_params(self) -> bytes:
+        """Encode parameters for broadcast_tx methods"""
+        return b'{"tx":"%b"}' % base64.b64encode(self._get_random_bytes(random.randint(32, 128)))
+    
+    def _encode_height_params(self) -> bytes:
+        """Encode parameters for block, block_results and commit"""
+        return random.choice(_HEIGHT_PARAMS)
+    
+    def _encode_blockchain_params(self) -> bytes:
+        """Encode parameters for blockchain"""
+        min_height = random.randint(1, 500)
+        return b'{"minHeight":"%d","maxHeight":"%d"}' % (min_height, min_height + random.randint(1, 500))
+    
+    def _encode_validators_params(self) -> bytes:
+        """Encode parameters for validators"""
+        return b'{"height":"%d","page":"%d","per_page":"%d"}' % (
+            random.randint(1, 1000), random.randint(1, 5), random.randint(10, 100)
+        )
+    
+    def _encode_unconfirmed_txs_params(self) -> bytes:
+        """Encode parameters for unconfirmed_txs"""
+        return random.choice(_UNCONFIRMED_TXS_PARAMS)
+    
+    def _encode_abci_query_params(self) -> bytes:
+        """Encode parameters for abci_query"""
+        return b'{"path":%b,"data":%b,"height":"%d","prove":%b}' % (
+            random.choice(_QUERY_PATHS_JSON), random.choice(self._query_data_json),
+            random.randint(1, 1000), _BOOL_JSON[random.getrandbits(1)]
+        )
+    
+    def _encode_tx_params(self) -> bytes:
+        """Encode parameters for tx"""
+        return b'{"hash":%b,"prove":%b}' % (random.choice(self._tx_hash_json), _BOOL_JSON[random.getrandbits(1)])
+    
+    def _encode_tx_search_params(self) -> bytes:
+        """Encode parameters for tx_search"""
+        # prove and order_by are decided by one bit each of a single draw
+        flips = random.getrandbits(2)
+        return b'{"query":"tx.height=%d","prove":%b,"page":"%d","per_page":"%d","order_by":"%b"}' % (
+            random.randint(1, 1000), _BOOL_JSON[flips & 1], random.randint(1, 5), random.randint(10, 100),
+            b"desc" if flips & 2 else b"asc"
+        )
+    
+    def _encode_request(self, method: str, request_id: int) -> bytes:
+        """Generate parameters for a method and encode the JSON-RPC request"""
+        return self._request_templates[method] % (request_id, self.param_encoders[method]())
+    
+    async def _send_request(self, method: str) -> Tuple[bool, int]:
         """
         Send a request to the ABCI RPC endpoint
         
@@ -298,73 +462,218 @@ class ABCIFloodTester:
             method: The method to call
             
         Returns:
-            Tuple of (success, response_time)
+            Tuple of (success, response_time_ns)
         """
-        # Generate parameters for the method
-        params = self.param_generators[method]()
+        request = self._encode_request(method, self._get_request_id())
         
-        # Create the JSON-RPC request
-        request = {
-            "jsonrpc": "2.0",
-            "id": self._get_request_id(),
-            "method": method,
-            "params": params
-        }
-        
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         try:
-            async with self.session.post(self.url, json=request) as response:
-                response_text = await response.text()
-                response_time = time.time() - start_time
+            async with self.session.post(self.url, data=request, headers=json_utils.JSON_HEADERS) as response:
+                # Parse the raw body, it is only decoded to text when it has to be shown
+                response_body = await response.read()
+                response_time = time.perf_counter_ns() - start_time
                 
                 if response.status == 200:
+                    # Most responses are results, they are recognized without parsing the body
+                    if not (__debug__ and self.verbose) and json_utils.is_result_object(response_body):
+                        return True, response_time
+                    
                     try:
-                        response_json = json.loads(response_text)
+                        response_json = json_utils.loads(response_body)
                         if "error" in response_json:
                             # Log failed request
                             self._log_failed_request(method, request, response_json)
-                            if self.verbose:
-                                print(f"\n{Fore.RED}Error for method {method}: {response_json['error']}{Style.RESET_ALL}")
+                            if __debug__ and self.verbose:
+                                self.verbose_log.write(f"{Fore.RED}Error for method {method}: {response_json['error']}{Style.RESET_ALL}")
                             return False, response_time
                         else:
-                            if self.verbose:
-                                print(f"\n{Fore.GREEN}Request: {json.dumps(request)}{Style.RESET_ALL}")
-                                print(f"{Fore.GREEN}Response: {response_text}{Style.RESET_ALL}")
+                            if __debug__ and self.verbose:
+                                self.verbose_log.write(_VERBOSE_REQUEST + request + _VERBOSE_RESET)
+                                self.verbose_log.write(_VERBOSE_RESPONSE + response_body + _VERBOSE_RESET)
                             return True, response_time
-                    except json.JSONDecodeError:
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        response_text = response_body.decode(errors="replace")
                         # Log failed request
                         self._log_failed_request(method, request, f"Invalid JSON: {response_text}")
-                        if self.verbose:
-                            print(f"\n{Fore.RED}Invalid JSON response for method {method}: {response_text}{Style.RESET_ALL}")
+                        if __debug__ and self.verbose:
+                            self.verbose_log.write(f"{Fore.RED}Invalid JSON response for method {method}: {response_text}{Style.RESET_ALL}")
                         return False, response_time
                 else:
+                    response_text = response_body.decode(errors="replace")
                     # Log failed request
                     self._log_failed_request(method, request, f"HTTP {response.status}: {response_text}")
-                    if self.verbose:
-                        print(f"\n{Fore.RED}Error for method {method}: {response.status} - {response_text}{Style.RESET_ALL}")
+                    if __debug__ and self.verbose:
+                        self.verbose_log.write(f"{Fore.RED}Error for method {method}: {response.status} - {response_text}{Style.RESET_ALL}")
                     return False, response_time
         except Exception as e:
+            response_time = time.perf_counter_ns() - start_time
             # Log failed request
             self._log_failed_request(method, request, f"Exception: {str(e)}")
-            if self.verbose:
-                print(f"\n{Fore.RED}Exception for method {method}: {str(e)}{Style.RESET_ALL}")
+            if __debug__ and self.verbose:
+                self.verbose_log.write(f"{Fore.RED}Exception for method {method}: {str(e)}{Style.RESET_ALL}")
             return False, response_time
     
-    def _log_failed_request(self, method: str, request: Dict, error: Any):
+    async def _send_batch(self, methods: List[str]) -> Optional[List[Tuple[bool, int]]]:
+        """
+        Send several requests to the ABCI RPC endpoint in a single JSON-RPC batch request
+        
+        Args:
+            methods: The methods to call, one request per entry
+            
+        Returns:
+            List of (success, response_time_ns) tuples in the same order as methods,
+            or None if the endpoint answered with a single error object because it
+            does not accept batches
+        """
+        requests = []
+        for method in methods:
+            request_id = self._get_request_id()
+            requests.append((method, request_id, self._encode_request(method, request_id)))
+        body = b"[" + b",".join(request for _, _, request in requests) + b"]"
+        
+        start_time = time.perf_counter_ns()
+        try:
+            async with self.session.post(self.url, data=body, headers=json_utils.JSON_HEADERS) as response:
+                response_body = await response.read()
+                response_time = time.perf_counter_ns() - start_time
+                
+                if response.status != 200:
+                    error = f"HTTP {response.status}: {response_body.decode(errors='replace')}"
+                    return self._fail_batch(requests, response_time, error)
+                try:
+                    response_json = json_utils.loads(response_body)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    error = f"Invalid JSON: {response_body.decode(errors='replace')}"
+                    return self._fail_batch(requests, response_time, error)
+                # A single error object means the endpoint does not accept batches
+                if isinstance(response_json, dict) and "error" in response_json:
+                    return None
+                if not isinstance(response_json, list):
+                    error = f"Invalid batch response: {response_body.decode(errors='replace')}"
+                    return self._fail_batch(requests, response_time, error)
+        except Exception as e:
+            return self._fail_batch(requests, time.perf_counter_ns() - start_time, f"Exception: {str(e)}")
+        
+        # Batch responses may come back in any order, match them by id
+        responses = {item.get("id"): item for item in response_json if isinstance(item, dict)}
+        results = []
+        for method, request_id, request in requests:
+            item = responses.get(request_id)
+            if item is None:
+                self._log_failed_request(method, request, "Missing response in batch")
+                results.append((False, response_time))
+            elif "error" in item:
+                self._log_failed_request(method, request, item)
+                if __debug__ and self.verbose:
+                    self.verbose_log.write(f"{Fore.RED}Error for method {method}: {item['error']}{Style.RESET_ALL}")
+                results.append((False, response_time))
+            else:
+                if __debug__ and self.verbose:
+                    self.verbose_log.write(_VERBOSE_REQUEST + request + _VERBOSE_RESET)
+                    self.verbose_log.write(_VERBOSE_RESPONSE + json_utils.dumps(item) + _VERBOSE_RESET)
+                results.append((True, response_time))
+        return results
+    
+    def _fail_batch(self, requests: List[Tuple[str, int, bytes]], response_time: int,
+                    error: str) -> List[Tuple[bool, int]]:
+        """
+        Log every request of a failed batch and return their failed results
+        
+        Args:
+            requests: Tuples of (method, request_id, request) of the batch
+            response_time: Response time of the batch in nanoseconds
+            error: Description of the failure
+            
+        Returns:
+            List of (False, response_time) tuples, one per request
+        """
+        for method, _, request in requests:
+            self._log_failed_request(method, request, error)
+        if __debug__ and self.verbose:
+            self.verbose_log.write(f"{Fore.RED}Error for batch of {len(requests)} requests: {error}{Style.RESET_ALL}")
+        return [(False, response_time)] * len(requests)
+    
+    async def _produce_requests(self, queue: asyncio.Queue, rate_limiter: TokenBucket, methods: List[str]):
+        """
+        Queue batches of random methods, taking a token from the rate limiter per method
+        
+        Args:
+            queue: Queue consumed by the workers
+            rate_limiter: Token bucket pacing the requests
+            methods: Methods to pick from
+        """
+        methods = tuple(methods)
+        while True:
+            # Draw methods in chunks rather than calling random.choice per request
+            batch_size = self.batch_size
+            chosen = random.choices(methods, k=256 * batch_size)
+            for i in range(0, len(chosen), batch_size):
+                batch = chosen[i:i + batch_size]
+                await rate_limiter.acquire(len(batch))
+                await queue.put(batch)
+    
+    async def _worker(self, queue: asyncio.Queue):
+        """
+        Send requests for queued batches of methods until cancelled
+        
+        Args:
+            queue: Queue of method batches to call
+        """
+        while True:
+            methods = await queue.get()
+            try:
+                self.stats["requests_by_method"].update(methods)
+                
+                # The send methods catch their own exceptions
+                results = None
+                if len(methods) > 1:
+                    results = await self._send_batch(methods)
+                    if results is None and self.batch_size > 1:
+                        # Fall back to single requests for the rest of the run
+                        self.batch_size = 1
+                        print(f"\n{Fore.YELLOW}Endpoint rejected a batch request, sending single requests instead{Style.RESET_ALL}")
+                
+                if results is None:
+                    results = [await self._send_request(method) for method in methods]
+                
+                self._record_results(methods, results)
+            finally:
+                queue.task_done()
+    
+    def _record_results(self, methods: List[str], results: List[Tuple[bool, int]]):
+        """
+        Update the statistics with the results of one HTTP request
+        
+        The send methods return a result for every method instead of raising,
+        so the results are unpacked without checking for exceptions.
+        
+        Args:
+            methods: The methods that were called
+            results: Tuples of (success, response_time_ns) in the same order as methods
+        """
+        record_response_time = self.response_times.append
+        failed = []
+        for method, (success, response_time) in zip(methods, results):
+            record_response_time(response_time)
+            if not success:
+                failed.append(method)
+        
+        self.stats["total_requests"] += len(results)
+        self.stats["successful_requests"] += len(results) - len(failed)
+        if failed:
+            self.stats["failed_requests"] += len(failed)
+            self.stats["errors_by_method"].update(failed)
+    
+    def _log_failed_request(self, method: str, request: Union[Dict, bytes], error: Any):
         """
         Log a failed request to the log file
         
         Args:
             method: The method that failed
-            request: The request that was sent
+            request: The request that was sent, either as a dict or its serialized body
             error: The error response or exception
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with open(self.log_file, "a") as f:
-            f.write(f"[{timestamp}] {method}\n")
-            f.write(f"Request: {json.dumps(request, indent=2)}\n")
-            f.write(f"Error: {json.dumps(error, indent=2) if isinstance(error, dict) else str(error)}\n")
-            f.write("-" * 80 + "\n\n")
+        self.failure_log.write(method, request, error)
     
     async def run(self, duration: int = 60):
         """
@@ -373,14 +682,22 @@ class ABCIFloodTester:
         Args:
             duration: Duration of the test in seconds
         """
+        init_colors()
+        self._ensure_log_file()
+        
         print(f"{Fore.CYAN}Starting ABCI RPC flood testing against {self.url}{Style.RESET_ALL}")
         print(f"{Fore.CYAN}Testing methods: {', '.join(self.methods)}{Style.RESET_ALL}")
         print(f"{Fore.CYAN}Requests per second: {self.requests_per_second}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Workers: {self.workers}{Style.RESET_ALL}")
+        if self.batch_size > 1:
+            print(f"{Fore.CYAN}Batch size: {self.batch_size}{Style.RESET_ALL}")
         print(f"{Fore.CYAN}Duration: {duration} seconds{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Event loop: {type(asyncio.get_running_loop()).__module__.split('.')[0]}{Style.RESET_ALL}")
         print(f"{Fore.CYAN}Failed requests will be logged to: {Fore.YELLOW}{self.log_file}{Style.RESET_ALL}")
         
         # Create session
         await self._create_session()
+        self.failure_log.start()
         
         # Check if service is available
         service_available = await self._check_service_availability()
@@ -410,65 +727,48 @@ class ABCIFloodTester:
         self.stats["start_time"] = time.time()
         end_time = self.stats["start_time"] + duration
         
-        # Create a progress bar
-        with tqdm(total=duration, desc="Testing progress", unit="s") as pbar:
+        if self.verbose:
+            self.verbose_log.start()
+        
+        # Requests are paced by the token bucket and sent in batches by a fixed pool of workers,
+        # which keeps the number of HTTP requests in flight bounded by the pool size
+        rate_limiter = self.rate_limiter or TokenBucket(self.requests_per_second)
+        rate_limiter.start()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.workers)
+        pacer = asyncio.ensure_future(self._produce_requests(queue, rate_limiter, available_method_list))
+        workers = [asyncio.ensure_future(self._worker(queue)) for _ in range(self.workers)]
+        
+        # Progress is printed once per second from its own task
+        progress = ProgressTicker(duration, self.stats)
+        progress.start()
+        try:
             try:
-                while time.time() < end_time:
-                    start_loop = time.time()
-                    
-                    # Create tasks for this batch
-                    tasks = []
-                    methods_for_this_batch = []
-                    
-                    for _ in range(self.requests_per_second):
-                        # Select a random method from available methods
-                        method = random.choice(list(self.stats["available_methods"]))
-                        methods_for_this_batch.append(method)
-                        tasks.append(self._send_request(method))
-                        self.stats["requests_by_method"][method] += 1
-                    
-                    # Execute tasks
-                    results = await asyncio.gather(*tasks, return_exceptions=True)
-                    
-                    # Update statistics
-                    for result, method in zip(results, methods_for_this_batch):
-                        if isinstance(result, Exception):
-                            self.stats["failed_requests"] += 1
-                            self.stats["errors_by_method"][method] += 1
-                            # Log failed request
-                            self._log_failed_request(method, {"method": method, "error": str(result)}, f"Exception: {str(result)}")
-                            if self.verbose:
-                                print(f"\n{Fore.RED}Exception for method {method}: {str(result)}{Style.RESET_ALL}")
-                        else:
-                            success, response_time = result
-                            if success:
-                                self.stats["successful_requests"] += 1
-                            else:
-                                self.stats["failed_requests"] += 1
-                                self.stats["errors_by_method"][method] += 1
-                            
-                            if response_time < self.stats["min_response_time"]:
-                                self.stats["min_response_time"] = response_time
-                            if response_time > self.stats["max_response_time"]:
-                                self.stats["max_response_time"] = response_time
-                            self.stats["total_response_time"] += response_time
-                    
-                    # Sleep to maintain the requests per second rate
-                    elapsed = time.time() - start_loop
-                    if elapsed < 1.0:
-                        await asyncio.sleep(1.0 - elapsed)
-                    
-                    # Update progress bar
-                    pbar.update(1)
-                    
-                    # Update total requests count
-                    self.stats["total_requests"] += len(tasks)
-            
-            except KeyboardInterrupt:
+                await asyncio.sleep(max(0.0, end_time - time.time()))
+            except (asyncio.CancelledError, KeyboardInterrupt) as e:
+                # Ctrl+C only ends the test early, what is in flight is still recorded for the report
                 print(f"\n{Fore.YELLOW}Test interrupted by user.{Style.RESET_ALL}")
+                # The cancellation is handled here, so withdraw it from the task, or later
+                # timeouts in the same task would see it as still pending (Python 3.11+)
+                task = asyncio.current_task()
+                if isinstance(e, asyncio.CancelledError) and hasattr(task, "uncancel"):
+                    task.uncancel()
+            
+            # Stop producing, then let the workers send what is already queued
+            pacer.cancel()
+            await queue.join()
+        finally:
+            pacer.cancel()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(pacer, *workers, return_exceptions=True)
+            if self.rate_limiter is None:
+                await rate_limiter.stop()
+            await progress.stop()
+            await self.verbose_log.stop()
         
         # Record end time
         self.stats["end_time"] = time.time()
+        self._summarize_response_times()
         
         # Close session
         await self._close_session()
@@ -476,6 +776,13 @@ class ABCIFloodTester:
         # Print report
         self._print_report()
     
+    def _summarize_response_times(self):
+        """Fill the response time statistics, in seconds, from the recorded response times"""
+        if self.response_times:
+            self.stats["min_response_time"] = min(self.response_times) / 1e9
+            self.stats["max_response_time"] = max(self.response_times) / 1e9
+            self.stats["total_response_time"] = sum(self.response_times) / 1e9
+    
     def _print_report(self):
         """Print the test report"""
         actual_duration = self.stats["end_time"] - self.stats["start_time"]
@@ -536,7 +843,7 @@ class ABCIFloodTester:
             print(f"{Fore.RED}Error connecting to endpoint: {str(e)}{Style.RESET_ALL}")
             return False
     
-    async def _send_tendermint_request(self, method: str) -> Tuple[bool, float]:
+    async def _send_tendermint_request(self, method: str) -> Tuple[bool, int]:
         """Try sending request in Tendermint RPC format"""
         # Strip abci_ prefix if present
         abci_method = method
@@ -550,7 +857,7 @@ class ABCIFloodTester:
             "method": "abci_query",
             "params": {
                 "path": abci_method,
-                "data": base64.b64encode(json.dumps(self.param_generators[abci_method]()).encode()).decode(),
+                "data": base64.b64encode(json_utils.dumps(self.param_generators[abci_method]())).decode(),
                 "height": "0",
                 "prove": False
             }
@@ -1,25 +1,105 @@
 """
 ABCI Query Fuzzer module for Storm
+
+The fuzzer is all network I/O, for full throughput install the fast extra,
+which runs it on the uvloop event loop.
 """
 
 import asyncio
+from collections import OrderedDict
+import functools
+from array import array
 import json
 import random
+import re
 import time
 import base64
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import Dict, List, Any, Optional, Tuple, Set, Callable, Iterator, Sequence, Union
 import aiohttp
 import colorama
 from colorama import Fore, Style
 import os
 import sys
 
+from . import json_utils
+from .log_buffer import LogBuffer
+from .session import create_session
+
+# Option pools for the random query parameters, built once instead of on every call
+QUERY_HEIGHTS = ("0", "1", "10", "100", "latest")
+PROVE_OPTIONS = (True, False)
+SAMPLE_DENOMS = ("uatom", "stake", "ustake")
+# Number of random sample values drawn at once
+RANDOM_PICKS_SIZE = 4096
+# Number of recent probes remembered to skip repeats, and redraws before skipping one
+TRIED_PROBES_SIZE = 200_000
+MAX_PROBE_REDRAWS = 8
+# Seconds between progress lines, and their colors formatted once
+PROGRESS_INTERVAL = 1.0
+PROGRESS_PREFIX = f"{Fore.CYAN}Progress: "
+PROGRESS_SUFFIX = f"{Style.RESET_ALL}\n"
+
+def _random_picks(options: Sequence[Any]) -> Iterator[Any]:
+    """
+    Endlessly yield random picks from options, drawn in bulk
+    
+    random.choices draws a whole block in one call, which is much cheaper
+    than a random.choice call per value. The options are read again at
+    the start of every block.
+    """
+    while True:
+        yield from random.choices(options, k=RANDOM_PICKS_SIZE)
+
+def _interned(values: Sequence[str]) -> Tuple[str, ...]:
+    """Get a tuple of the values as interned strings"""
+    return tuple(sys.intern(value) for value in values)
+
+@functools.lru_cache(maxsize=1024)
+def _encode_query_data(**fields: str) -> str:
+    """
+    Convert query data to JSON and base64 encode it
+    
+    The fields are drawn from small sample lists, so the same few payloads
+    come up again and again and are only encoded once. The cache is keyed
+    by value and shared by all fuzzers and runs in the process.
+    """
+    return base64.b64encode(json_utils.dumps(fields)).decode()
+
+# Query data of the paths that take no parameters, an empty object
+EMPTY_QUERY_DATA = _encode_query_data()
+
+# JSON-RPC body of an ABCI query, filled in with the id, the JSON encoded path,
+# data and height, and the prove flag
+_QUERY_TEMPLATE = b'{"jsonrpc":"2.0","id":%d,"method":"abci_query","params":{"path":%b,"data":%b,"height":%b,"prove":"%b"}}'
+# The prove flag is sent as a string, indexed by the flag converted to bool
+_PROVE_VALUES = {True: b"true", False: b"false"}
+# Marks a failed query in a raw response body: a JSON-RPC error, or an ABCI
+# response with a nonzero code (a zero code is left out by CometBFT)
+_FAILED_QUERY_PATTERN = re.compile(rb'"error"\s*:|"code"\s*:\s*[1-9]')
+
+# Endpoint checks run before the discovery, with distinct ids so they can share a batch
+STATUS_REQUEST = {"jsonrpc": "2.0", "id": 1, "method": "status", "params": []}
+ABCI_INFO_REQUEST = {"jsonrpc": "2.0", "id": 2, "method": "abci_info", "params": []}
+DIRECT_QUERY_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": 3,
+    "method": "abci_query",
+    "params": {
+        "path": "/app/version",  # Often available in Cosmos apps
+        "data": "",
+        "height": "0",
+        "prove": "false"
+    }
+}
+PREFLIGHT_REQUESTS = [STATUS_REQUEST, ABCI_INFO_REQUEST, DIRECT_QUERY_REQUEST]
+
 class ABCIQueryFuzzer:
     """
     Specialized fuzzer for ABCI query endpoint
     """
 
-    def __init__(self, url: str, verbose: bool = False, actor_address: Optional[str] = None):
+    def __init__(self, url: str, verbose: bool = False, actor_address: Optional[str] = None,
+                 session: Optional[aiohttp.ClientSession] = None, concurrency: int = 50, batch_size: int = 10):
         """
         Initialize the ABCI Query Fuzzer
         
@@ -27,28 +107,66 @@ class ABCIQueryFuzzer:
             url: URL of the ABCI RPC endpoint
             verbose: Whether to print verbose output
             actor_address: Optional known actor address to use in queries
+            session: Optional shared aiohttp session (closed by the caller)
+            concurrency: Maximum number of HTTP requests in flight at once
+            batch_size: Number of queries sent per JSON-RPC batch request
         """
         self.url = url
         self.verbose = verbose
+        # Verbose output is buffered and printed once per second
+        self.verbose_log = LogBuffer()
         self.actor_address = actor_address
-        self.session = None
+        self.session = session
+        self._owns_session = session is None
+        self.concurrency = max(1, concurrency)
+        self.batch_size = max(1, batch_size)
+        self.request_id = 0
         self.stats = {
             "total_queries": 0,
             "successful_queries": 0,
             "failed_queries": 0,
-            "paths_tried": set(),
-            "successful_paths": set(),
-            "failed_paths": {},  # path -> count
-            "min_response_time": float('inf'),
-            "max_response_time": 0,
-            "total_response_time": 0,
+            # Path templates are tracked by their index in self.template_names:
+            # bitmasks of the templates tried and found working, failure counts per index
+            "paths_tried": 0,
+            "successful_paths": 0,
+            "failed_paths": [],
+            "skipped_probes": 0,
+            # Response times in nanoseconds, converted for the report
+            "min_response_time_ns": None,
+            "max_response_time_ns": 0,
+            "total_response_time_ns": 0,
         }
+        # Outcome of every attempt of a run by completion order, filled in by
+        # _record_attempt and folded into the stats once the run is done
+        self._attempt_templates = array("i")
+        self._attempt_successes = bytearray()
+        self._attempt_times = array("q")
+        self._attempts_recorded = 0
+        self._last_progress = 0.0
+        # Probes already sent, as (path, data, height, prove). The same probe gets
+        # the same answer from an endpoint, so repeats are redrawn instead of sent.
+        # Working probes are kept for good, the others only while they are recent.
+        self._tried_probes: "OrderedDict[Tuple[str, str, str, bool], None]" = OrderedDict()
+        self._working_probes: Set[Tuple[str, str, str, bool]] = set()
         
         # Create log directory if it doesn't exist
         os.makedirs("logs", exist_ok=True)
         
         # Define common path patterns for different Cosmos SDK modules
         self.path_templates = [
+            # Simple paths that are likely to work
+            "/",
+            "/app/info",
+            "/app/version",
+            "/info",
+            "/version",
+            "/store",
+            "/key",
+            "/custom",
+            "/p2p/filter/addr",
+            "/p2p/filter/id",
+            "/validators",
+            
             # Bank module
             "/store/bank/key",
             "/cosmos.bank.v1beta1.Query/AllBalances",
@@ -143,89 +261,170 @@ class ABCIQueryFuzzer:
         
         self.sample_proposals = ["1", "2", "3", "10", "100"]
         
+        # The templates and samples are fixed from here on, freeze them as
+        # tuples of interned strings
+        self.path_templates = _interned(self.path_templates)
+        self.sample_addresses = _interned(self.sample_addresses)
+        self.sample_cids = _interned(self.sample_cids)
+        self.sample_coins = _interned(self.sample_coins)
+        self.sample_proposals = _interned(self.sample_proposals)
+        
+        # Random sample values for the path and data generators
+        self._next_address = _random_picks(self.sample_addresses).__next__
+        self._next_cid = _random_picks(self.sample_cids).__next__
+        self._next_denom = _random_picks(SAMPLE_DENOMS).__next__
+        self._next_proposal = _random_picks(self.sample_proposals).__next__
+        
+        # Data generators per path template, templates added later get theirs on first use
+        self._data_builders: Dict[str, Callable[[], str]] = {
+            path: self._make_data_builder(path) for path in self.path_templates
+        }
+        
+        # Stable index of every path template ever used, for the stats bitmasks
+        self.template_names: List[str] = []
+        self._template_index: Dict[str, int] = {}
+        # Path generators by template index
+        self._path_builders: List[Callable[[bool], str]] = []
+        self._register_templates()
+        
+    async def __aenter__(self) -> "ABCIQueryFuzzer":
+        """Create the session, kept open across discover_working_paths runs until exit"""
+        await self.create_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close_session()
+    
     async def create_session(self):
         """Create an aiohttp session"""
-        self.session = aiohttp.ClientSession()
+        if self.session is None:
+            self.session = create_session(self.concurrency)
     
     async def close_session(self):
         """Close the aiohttp session"""
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
+            self.session = None
     
-    def _get_random_height(self) -> str:
-        """Get a random height"""
-        options = ["0", "1", "10", "100", "latest"]
-        return random.choice(options)
+    def _register_templates(self):
+        """Assign an index to templates new in path_templates and list the indices to draw from"""
+        for path in self.path_templates:
+            if path not in self._template_index:
+                self._template_index[path] = len(self.template_names)
+                self.template_names.append(path)
+                self._path_builders.append(self._make_path_builder(path))
+                self.stats["failed_paths"].append(0)
+        self._active_templates = tuple(self._template_index[path] for path in self.path_templates)
     
-    def _get_random_prove(self) -> bool:
-        """Get a random prove value"""
-        return random.choice([True, False])
+    def _templates_in(self, mask: int) -> List[str]:
+        """Get the path templates whose bits are set in a stats bitmask"""
+        return [path for index, path in enumerate(self.template_names) if (mask >> index) & 1]
     
-    def _replace_path_params(self, path: str) -> str:
+    def _make_path_builder(self, path_template: str) -> Callable[[bool], str]:
+        """
+        Pick the path generator for a template, checking for path parameters once
+        
+        Args:
+            path_template: Query path template
+            
+        Returns:
+            Function taking whether this is the first query of the template
+            and returning the path to query
+        """
+        address_params = path_template.count("{address}")
+        cid_params = path_template.count("{cid}")
+        if not address_params and not cid_params:
+            return lambda first_query: path_template
+        
+        # A single parameter is filled in between the parts around it, without a replace scan
+        if address_params == 1 and not cid_params:
+            prefix, suffix = path_template.split("{address}")
+            actor_address = self.actor_address
+            next_address = self._next_address
+            if actor_address:
+                return lambda first_query: prefix + (actor_address if first_query else next_address()) + suffix
+            return lambda first_query: prefix + next_address() + suffix
+        if cid_params == 1 and not address_params:
+            prefix, suffix = path_template.split("{cid}")
+            next_cid = self._next_cid
+            return lambda first_query: prefix + next_cid() + suffix
+        return lambda first_query: self._replace_path_params(path_template, first_query)
+    
+    def _replace_path_params(self, path: str, first_query: bool = False) -> str:
         """Replace path parameters with random values"""
         if "{address}" in path:
             # If we have a provided actor address and this is the first query for this path type,
             # always use the provided address first
-            if self.actor_address and path not in self.stats["paths_tried"]:
+            if self.actor_address and first_query:
                 path = path.replace("{address}", self.actor_address)
             else:
-                path = path.replace("{address}", random.choice(self.sample_addresses))
+                path = path.replace("{address}", self._next_address())
         if "{cid}" in path:
-            path = path.replace("{cid}", random.choice(self.sample_cids))
+            path = path.replace("{cid}", self._next_cid())
         return path
     
-    def _generate_data_for_path(self, path: str) -> str:
-        """Generate appropriate data for a given path"""
-        # Default to empty object
-        data = {}
+    def _make_data_builder(self, path: str) -> Callable[[], str]:
+        """
+        Pick the data generator for a path, classified once instead of on every query
+        
+        Args:
+            path: Query path or path template
+            
+        Returns:
+            Function returning freshly randomized, base64 encoded data for the path
+        """
+        address = self._next_address
+        denom = self._next_denom
+        proposal = self._next_proposal
+        encode = _encode_query_data
         
         # Bank module
         if "AllBalances" in path:
-            data = {"address": random.choice(self.sample_addresses)}
+            return lambda: encode(address=address())
         elif "Balance" in path:
-            data = {
-                "address": random.choice(self.sample_addresses),
-                "denom": random.choice(["uatom", "stake", "ustake"])
-            }
+            return lambda: encode(
+                address=address(),
+                denom=denom()
+            )
         elif "SupplyOf" in path:
-            data = {"denom": random.choice(["uatom", "stake", "ustake"])}
+            return lambda: encode(denom=denom())
         
         # Staking module
         elif "Validator" in path and not "Validators" in path:
-            data = {"validator_addr": random.choice(self.sample_addresses)}
+            return lambda: encode(validator_addr=address())
         elif "Delegation" in path:
-            data = {
-                "delegator_addr": random.choice(self.sample_addresses),
-                "validator_addr": random.choice(self.sample_addresses)
-            }
+            return lambda: encode(
+                delegator_addr=address(),
+                validator_addr=address()
+            )
         
         # Governance module
         elif "Proposal" in path and not "Proposals" in path:
-            data = {"proposal_id": random.choice(self.sample_proposals)}
+            return lambda: encode(proposal_id=proposal())
         elif "Vote" in path and not "Votes" in path:
-            data = {
-                "proposal_id": random.choice(self.sample_proposals),
-                "voter": random.choice(self.sample_addresses)
-            }
+            return lambda: encode(
+                proposal_id=proposal(),
+                voter=address()
+            )
         
         # Auth module
         elif "Account" in path and not "Accounts" in path:
-            data = {"address": random.choice(self.sample_addresses)}
-        
-        # FVM specific paths
-        elif "/fvm/ipld/" in path:
-            # Already handled in path parameter replacement
-            pass
-        elif "/fvm/actor_" in path:
-            # Already handled in path parameter replacement
-            pass
+            return lambda: encode(address=address())
         
-        # Convert to JSON and base64 encode
-        return base64.b64encode(json.dumps(data).encode()).decode()
+        # Everything else, including the FVM paths whose parameters are in the path,
+        # sends an empty object, which is the same every time
+        return lambda: EMPTY_QUERY_DATA
+    
+    def _generate_data_for_path(self, path: str) -> str:
+        """Generate appropriate data for a given path"""
+        builder = self._data_builders.get(path)
+        if builder is None:
+            builder = self._data_builders[path] = self._make_data_builder(path)
+        return builder()
     
-    async def query(self, path: str, data: str = "", height: str = "0", prove: bool = False) -> Tuple[bool, float, Any]:
+    def _encode_query(self, path: str, data: str, height: str, prove: bool) -> Tuple[int, bytes]:
         """
-        Send an ABCI query
+        Serialize an ABCI query straight into its JSON-RPC body
         
         Args:
             path: Query path
@@ -234,207 +433,503 @@ class ABCIQueryFuzzer:
             prove: Whether to include proofs
             
         Returns:
-            Tuple of (success, response_time, response)
-        """
-        # Build query parameters
-        params = {
-            "path": path,
-            "data": data,
-            "height": height,
-            "prove": str(prove).lower()
-        }
+            Tuple of (request id, request body)
+        """
+        self.request_id += 1
+        return self.request_id, _QUERY_TEMPLATE % (
+            self.request_id, json_utils.dumps(path), json_utils.dumps(data), json_utils.dumps(height),
+            _PROVE_VALUES[bool(prove)]
+        )
+    
+    def _check_response(self, response_json: Dict[str, Any]) -> bool:
+        """
+        Check whether a JSON-RPC response is a successful query
         
-        url = f"{self.url}"
+        Args:
+            response_json: The parsed response of a single query
+            
+        Returns:
+            bool: True if the query succeeded, False otherwise
+        """
+        # Check if there's an error in the response
+        if "error" in response_json:
+            if __debug__ and self.verbose:
+                self.verbose_log.write(f"{Fore.RED}Error: {response_json['error']}{Style.RESET_ALL}")
+            return False
         
-        # Create the JSON-RPC request
-        request = {
-            "jsonrpc": "2.0",
-            "id": str(random.randint(1, 1000000)),
-            "method": "abci_query",
-            "params": params
-        }
+        # Check if the result contains an error code
+        result = response_json.get("result", {})
+        response_value = result.get("response", {})
         
-        if self.verbose:
-            print(f"{Fore.CYAN}Querying path: {path}{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}Data: {data}{Style.RESET_ALL}")
+        if response_value.get("code", 0) != 0:
+            log_msg = f"Code: {response_value.get('code')}, Log: {response_value.get('log')}"
+            if __debug__ and self.verbose:
+                self.verbose_log.write(f"{Fore.YELLOW}Query failed: {log_msg}{Style.RESET_ALL}")
+            return False
+        
+        if __debug__ and self.verbose:
+            self.verbose_log.write(f"{Fore.GREEN}Query successful!{Style.RESET_ALL}")
+        return True
+    
+    async def query(self, path: str, data: str = "", height: str = "0", prove: bool = False) -> Tuple[bool, int, Any]:
+        """
+        Send an ABCI query
+        
+        Args:
+            path: Query path
+            data: Base64 encoded data
+            height: Block height (0 for latest)
+            prove: Whether to include proofs
+            
+        Returns:
+            Tuple of (success, response_time_ns, response). The response is the
+            parsed JSON, or the response text for HTTP errors and invalid JSON.
+            Failed queries recognized without parsing, outside verbose mode, have
+            None as their response.
+        """
+        _, request = self._encode_query(path, data, height, prove)
         
-        start_time = time.time()
+        if __debug__ and self.verbose:
+            self.verbose_log.write(f"{Fore.CYAN}Querying path: {path}{Style.RESET_ALL}")
+            self.verbose_log.write(f"{Fore.CYAN}Data: {data}{Style.RESET_ALL}")
+        
+        start_ns = time.perf_counter_ns()
         try:
-            async with self.session.post(url, json=request) as response:
-                response_text = await response.text()
-                response_time = time.time() - start_time
+            async with self.session.post(self.url, data=request, headers=json_utils.JSON_HEADERS) as response:
+                # Parse the raw body, it is only decoded to text when it has to be returned
+                response_body = await response.read()
+                response_time = time.perf_counter_ns() - start_ns
                 
                 if response.status == 200:
+                    # Most fuzzed queries fail, spot those without parsing the body,
+                    # unless the verbose output needs the error details
+                    if not (__debug__ and self.verbose) and _FAILED_QUERY_PATTERN.search(response_body):
+                        return False, response_time, None
                     try:
-                        response_json = json.loads(response_text)
-                        
-                        # Check if there's an error in the response
-                        if "error" in response_json:
-                            if self.verbose:
-                                print(f"{Fore.RED}Error: {response_json['error']}{Style.RESET_ALL}")
-                            return False, response_time, response_json
-                        
-                        # Check if the result contains an error code
-                        result = response_json.get("result", {})
-                        response_value = result.get("response", {})
-                        
-                        if response_value.get("code", 0) != 0:
-                            log_msg = f"Code: {response_value.get('code')}, Log: {response_value.get('log')}"
-                            if self.verbose:
-                                print(f"{Fore.YELLOW}Query failed: {log_msg}{Style.RESET_ALL}")
-                            return False, response_time, response_json
-                        
-                        if self.verbose:
-                            print(f"{Fore.GREEN}Query successful!{Style.RESET_ALL}")
-                        return True, response_time, response_json
-                    except json.JSONDecodeError:
-                        if self.verbose:
-                            print(f"{Fore.RED}Invalid JSON response: {response_text}{Style.RESET_ALL}")
+                        response_json = json_utils.loads(response_body)
+                        return self._check_response(response_json), response_time, response_json
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        response_text = response_body.decode(errors="replace")
+                        if __debug__ and self.verbose:
+                            self.verbose_log.write(f"{Fore.RED}Invalid JSON response: {response_text}{Style.RESET_ALL}")
                         return False, response_time, response_text
                 else:
-                    if self.verbose:
-                        print(f"{Fore.RED}HTTP error: {response.status} - {response_text}{Style.RESET_ALL}")
+                    response_text = response_body.decode(errors="replace")
+                    if __debug__ and self.verbose:
+                        self.verbose_log.write(f"{Fore.RED}HTTP error: {response.status} - {response_text}{Style.RESET_ALL}")
                     return False, response_time, response_text
                     
         except Exception as e:
-            response_time = time.time() - start_time
-            if self.verbose:
-                print(f"{Fore.RED}Exception: {str(e)}{Style.RESET_ALL}")
+            response_time = time.perf_counter_ns() - start_ns
+            if __debug__ and self.verbose:
+                self.verbose_log.write(f"{Fore.RED}Exception: {str(e)}{Style.RESET_ALL}")
             return False, response_time, str(e)
     
-    async def _validate_endpoint(self) -> bool:
+    async def query_batch(self, queries: List[Tuple[str, str, str, bool]]) -> Optional[List[Tuple[bool, int, Any]]]:
         """
-        Validate that the endpoint is a working Tendermint/ABCI endpoint
+        Send several ABCI queries in a single JSON-RPC batch request
         
+        Args:
+            queries: Tuples of (path, data, height, prove)
+            
         Returns:
-            bool: True if the endpoint is valid, False otherwise
+            List of (success, response_time_ns, response) tuples in the same order as queries,
+            or None if the endpoint answered with a single error object because it does
+            not accept batches
         """
-        print(f"{Fore.CYAN}Validating endpoint: {self.url}{Style.RESET_ALL}")
-        
-        # First try a simple status request to check if the endpoint is responsive
-        request = {
-            "jsonrpc": "2.0",
-            "id": "1",
-            "method": "status",
-            "params": []
-        }
+        request_ids = []
+        bodies = []
+        for path, data, height, prove in queries:
+            request_id, body = self._encode_query(path, data, height, prove)
+            request_ids.append(request_id)
+            bodies.append(body)
+            if __debug__ and self.verbose:
+                self.verbose_log.write(f"{Fore.CYAN}Querying path: {path}{Style.RESET_ALL}")
         
+        start_ns = time.perf_counter_ns()
         try:
-            async with self.session.post(self.url, json=request) as response:
-                response_text = await response.text()
+            async with self.session.post(self.url, data=b"[" + b",".join(bodies) + b"]", headers=json_utils.JSON_HEADERS) as response:
+                response_body = await response.read()
+                response_time = time.perf_counter_ns() - start_ns
                 
-                if response.status == 200:
-                    try:
-                        response_json = json.loads(response_text)
-                        if "result" in response_json:
-                            # It responded to a status request, likely a Tendermint node
-                            print(f"{Fore.GREEN}✓ Endpoint is responsive and appears to be a Tendermint node.{Style.RESET_ALL}")
-                            node_info = response_json.get("result", {}).get("node_info", {})
-                            if node_info:
-                                print(f"{Fore.GREEN}  Node version: {node_info.get('version', 'unknown')}{Style.RESET_ALL}")
-                                print(f"{Fore.GREEN}  Network: {node_info.get('network', 'unknown')}{Style.RESET_ALL}")
-                            return True
-                        elif "error" in response_json:
-                            # It responded with an error, but in JSON-RPC format
-                            print(f"{Fore.YELLOW}⚠ Endpoint responded with an error: {response_json['error'].get('message', 'Unknown error')}{Style.RESET_ALL}")
-                            print(f"{Fore.YELLOW}  This might still be a valid endpoint but 'status' method may not be supported.{Style.RESET_ALL}")
-                            return True
-                    except json.JSONDecodeError:
-                        # Not a JSON response, check if it's HTML
-                        if "<html" in response_text.lower():
-                            print(f"{Fore.RED}✗ Endpoint returned HTML instead of JSON. This is likely not a Tendermint RPC endpoint.{Style.RESET_ALL}")
-                            return False
-                        print(f"{Fore.RED}✗ Endpoint returned non-JSON response: {response_text[:100]}{Style.RESET_ALL}")
-                        return False
-                else:
-                    print(f"{Fore.RED}✗ Endpoint returned HTTP {response.status}: {response_text[:100]}{Style.RESET_ALL}")
-                    return False
+                if response.status != 200:
+                    response_text = response_body.decode(errors="replace")
+                    if __debug__ and self.verbose:
+                        self.verbose_log.write(f"{Fore.RED}HTTP error: {response.status} - {response_text}{Style.RESET_ALL}")
+                    return [(False, response_time, response_text)] * len(queries)
+                try:
+                    response_json = json_utils.loads(response_body)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    response_json = None
+                # A single error object means the endpoint does not accept batches
+                if isinstance(response_json, dict) and "error" in response_json:
+                    return None
+                if not isinstance(response_json, list):
+                    response_text = response_body.decode(errors="replace")
+                    if __debug__ and self.verbose:
+                        self.verbose_log.write(f"{Fore.RED}Invalid batch response: {response_text}{Style.RESET_ALL}")
+                    return [(False, response_time, response_text)] * len(queries)
         except Exception as e:
-            print(f"{Fore.RED}✗ Error connecting to endpoint: {str(e)}{Style.RESET_ALL}")
-            return False
+            response_time = time.perf_counter_ns() - start_ns
+            if __debug__ and self.verbose:
+                self.verbose_log.write(f"{Fore.RED}Exception: {str(e)}{Style.RESET_ALL}")
+            return [(False, response_time, str(e))] * len(queries)
         
-        # If we get here, the status check failed, try an abci_info request
-        request = {
-            "jsonrpc": "2.0",
-            "id": "1",
-            "method": "abci_info",
-            "params": []
-        }
+        # Batch responses may come back in any order, match them by id
+        responses = {item.get("id"): item for item in response_json if isinstance(item, dict)}
+        results = []
+        for request_id in request_ids:
+            item = responses.get(request_id)
+            if item is None:
+                results.append((False, response_time, "Missing response in batch"))
+            else:
+                results.append((self._check_response(item), response_time, item))
+        return results
+    
+    async def _post_check(self, request: Union[Dict[str, Any], List[Dict[str, Any]]]) -> Tuple[int, bytes]:
+        """
+        Send an endpoint check
+        
+        Args:
+            request: JSON-RPC request, or a batch of them
         
+        Returns:
+            Tuple of (HTTP status, raw response body)
+        """
+        async with self.session.post(self.url, data=json_utils.dumps(request), headers=json_utils.JSON_HEADERS) as response:
+            return response.status, await response.read()
+    
+    async def _preflight(self) -> Dict[Any, Any]:
+        """
+        Send all endpoint checks together in one batch request
+        
+        Returns:
+            The responses to the checks by request id, empty if the endpoint
+            did not answer the batch, the checks then send their own requests
+        """
         try:
-            async with self.session.post(self.url, json=request) as response:
-                response_text = await response.text()
-                
-                if response.status == 200:
-                    try:
-                        response_json = json.loads(response_text)
-                        if "result" in response_json:
-                            print(f"{Fore.GREEN}✓ Endpoint responded to abci_info, it appears to be a Tendermint node.{Style.RESET_ALL}")
-                            return True
-                    except json.JSONDecodeError:
-                        pass
+            status, body = await self._post_check(PREFLIGHT_REQUESTS)
+            response_json = json_utils.loads(body) if status == 200 else None
         except Exception:
-            pass
-            
+            return {}
+        # A single error object means the endpoint does not accept batches
+        if not isinstance(response_json, list):
+            return {}
+        return {item.get("id"): item for item in response_json if isinstance(item, dict)}
+    
+    async def _validate_endpoint(self, preflight: Dict[Any, Any]) -> bool:
+        """
+        Validate that the endpoint is a working Tendermint/ABCI endpoint
+        
+        Args:
+            preflight: Responses from _preflight, checks without one are sent here
+        
+        Returns:
+            bool: True if the endpoint is valid, False otherwise
+        """
+        print(f"{Fore.CYAN}Validating endpoint: {self.url}{Style.RESET_ALL}")
+        
+        # First check the status, to see if the endpoint is responsive
+        response_json = preflight.get(STATUS_REQUEST["id"])
+        if response_json is None:
+            try:
+                status, response_body = await self._post_check(STATUS_REQUEST)
+            except Exception as e:
+                print(f"{Fore.RED}✗ Error connecting to endpoint: {str(e)}{Style.RESET_ALL}")
+                return False
+            if status != 200:
+                print(f"{Fore.RED}✗ Endpoint returned HTTP {status}: {response_body[:100].decode(errors='replace')}{Style.RESET_ALL}")
+                return False
+            try:
+                response_json = json_utils.loads(response_body)
+            except json.JSONDecodeError:
+                # Not a JSON response, check if it's HTML
+                if b"<html" in response_body[:256].lower():
+                    print(f"{Fore.RED}✗ Endpoint returned HTML instead of JSON. This is likely not a Tendermint RPC endpoint.{Style.RESET_ALL}")
+                    return False
+                print(f"{Fore.RED}✗ Endpoint returned non-JSON response: {response_body[:100].decode(errors='replace')}{Style.RESET_ALL}")
+                return False
+        
+        if "result" in response_json:
+            # It responded to a status request, likely a Tendermint node
+            print(f"{Fore.GREEN}✓ Endpoint is responsive and appears to be a Tendermint node.{Style.RESET_ALL}")
+            node_info = response_json.get("result", {}).get("node_info", {})
+            if node_info:
+                print(f"{Fore.GREEN}  Node version: {node_info.get('version', 'unknown')}{Style.RESET_ALL}")
+                print(f"{Fore.GREEN}  Network: {node_info.get('network', 'unknown')}{Style.RESET_ALL}")
+            return True
+        elif "error" in response_json:
+            # It responded with an error, but in JSON-RPC format
+            print(f"{Fore.YELLOW}⚠ Endpoint responded with an error: {response_json['error'].get('message', 'Unknown error')}{Style.RESET_ALL}")
+            print(f"{Fore.YELLOW}  This might still be a valid endpoint but 'status' method may not be supported.{Style.RESET_ALL}")
+            return True
+        
+        # If we get here, the status check failed, try an abci_info request
+        response_json = preflight.get(ABCI_INFO_REQUEST["id"])
+        if response_json is None:
+            try:
+                status, response_body = await self._post_check(ABCI_INFO_REQUEST)
+                if status == 200:
+                    response_json = json_utils.loads(response_body)
+            except Exception:
+                pass
+        if isinstance(response_json, dict) and "result" in response_json:
+            print(f"{Fore.GREEN}✓ Endpoint responded to abci_info, it appears to be a Tendermint node.{Style.RESET_ALL}")
+            return True
+        
         # If both checks failed, this is probably not a Tendermint endpoint
         print(f"{Fore.RED}✗ Endpoint failed validation. This doesn't appear to be a Tendermint/ABCI RPC endpoint.{Style.RESET_ALL}")
         return False
     
-    async def _test_direct_query(self) -> bool:
+    async def _test_direct_query(self, preflight: Dict[Any, Any]) -> bool:
         """
         Test if abci_query works at all
         
+        Args:
+            preflight: Responses from _preflight, the query is sent here if it has none
+        
         Returns:
             bool: True if abci_query works, False otherwise
         """
         print(f"{Fore.CYAN}Testing if abci_query endpoint works...{Style.RESET_ALL}")
         
-        # Try a simple query with minimal parameters
-        params = {
-            "path": "/app/version",  # Often available in Cosmos apps
-            "data": "",
-            "height": "0",
-            "prove": "false"
-        }
-        
-        request = {
-            "jsonrpc": "2.0",
-            "id": "test",
-            "method": "abci_query",
-            "params": params
-        }
-        
+        response_json = preflight.get(DIRECT_QUERY_REQUEST["id"])
         try:
-            async with self.session.post(self.url, json=request) as response:
-                response_text = await response.text()
-                
-                if response.status == 200:
-                    try:
-                        response_json = json.loads(response_text)
-                        
-                        # Check if there's an error in the response
-                        if "error" in response_json:
-                            error_msg = response_json.get("error", {}).get("message", "Unknown error")
-                            print(f"{Fore.YELLOW}⚠ abci_query returned error: {error_msg}{Style.RESET_ALL}")
-                            if "not found" in error_msg.lower() or "method not found" in error_msg.lower():
-                                print(f"{Fore.RED}✗ The abci_query method is not supported by this endpoint.{Style.RESET_ALL}")
-                                return False
-                            print(f"{Fore.YELLOW}  This might be because the path is invalid, but the method exists.{Style.RESET_ALL}")
-                            return True
-                        
-                        # We got a successful response
-                        print(f"{Fore.GREEN}✓ abci_query endpoint is working!{Style.RESET_ALL}")
-                        return True
-                    except json.JSONDecodeError:
-                        print(f"{Fore.RED}✗ abci_query returned non-JSON response: {response_text[:100]}{Style.RESET_ALL}")
-                        return False
-                else:
-                    print(f"{Fore.RED}✗ abci_query returned HTTP {response.status}: {response_text[:100]}{Style.RESET_ALL}")
+            if response_json is None:
+                status, response_body = await self._post_check(DIRECT_QUERY_REQUEST)
+                if status != 200:
+                    print(f"{Fore.RED}✗ abci_query returned HTTP {status}: {response_body[:100].decode(errors='replace')}{Style.RESET_ALL}")
                     return False
+                try:
+                    response_json = json_utils.loads(response_body)
+                except json.JSONDecodeError:
+                    print(f"{Fore.RED}✗ abci_query returned non-JSON response: {response_body[:100].decode(errors='replace')}{Style.RESET_ALL}")
+                    return False
+            
+            # Check if there's an error in the response
+            if "error" in response_json:
+                error_msg = response_json.get("error", {}).get("message", "Unknown error")
+                print(f"{Fore.YELLOW}⚠ abci_query returned error: {error_msg}{Style.RESET_ALL}")
+                if "not found" in error_msg.lower() or "method not found" in error_msg.lower():
+                    print(f"{Fore.RED}✗ The abci_query method is not supported by this endpoint.{Style.RESET_ALL}")
+                    return False
+                print(f"{Fore.YELLOW}  This might be because the path is invalid, but the method exists.{Style.RESET_ALL}")
+                return True
+            
+            # We got a successful response
+            print(f"{Fore.GREEN}✓ abci_query endpoint is working!{Style.RESET_ALL}")
+            return True
         except Exception as e:
             print(f"{Fore.RED}✗ Error testing abci_query: {str(e)}{Style.RESET_ALL}")
             return False
 
+    def _random_attempt(self, template_index: int, height: str, prove: bool) -> Tuple[int, str, str, str, bool]:
+        """
+        Fill in a random path and parameter combination for a template
+        
+        The attempt has no side effects, it may still be discarded as a repeat.
+        The provided actor address is used until the template is marked as tried.
+        
+        Args:
+            template_index: Index of the randomly picked path template
+            height: Randomly picked block height
+            prove: Randomly picked prove value
+            
+        Returns:
+            Tuple of (template_index, path, data, height, prove)
+        """
+        path_template = self.template_names[template_index]
+        path = self._path_builders[template_index](not self.stats["paths_tried"] & (1 << template_index))
+        
+        # Generate appropriate data
+        return template_index, path, self._generate_data_for_path(path_template), height, prove
+    
+    async def _attempt_worker(self, semaphore: asyncio.Semaphore, batch_sizes: Iterator[int], max_attempts: int):
+        """
+        Query batches until the shared batch sizes are used up
+        
+        Args:
+            semaphore: Semaphore bounding the number of HTTP requests in flight
+            batch_sizes: Sizes of the batches still to send, shared by all workers
+            max_attempts: Total number of attempts, for progress output
+        """
+        for count in batch_sizes:
+            await self._attempt_batch(semaphore, count, max_attempts)
+    
+    async def _attempt_batch(self, semaphore: asyncio.Semaphore, count: int, max_attempts: int):
+        """
+        Query a batch of random path and parameter combinations and record the results
+        
+        Args:
+            semaphore: Semaphore bounding the number of HTTP requests in flight
+            count: Number of queries in the batch
+            max_attempts: Total number of attempts, for progress output
+        """
+        # Draw the template, height and prove picks for the whole batch at once
+        attempts = []
+        for template_index, height, prove in zip(
+            random.choices(self._active_templates, k=count),
+            random.choices(QUERY_HEIGHTS, k=count),
+            random.choices(PROVE_OPTIONS, k=count),
+        ):
+            attempt = self._new_attempt(template_index, height, prove)
+            if attempt is not None:
+                attempts.append(attempt)
+        if not attempts:
+            return
+        
+        # Send the queries, as a batch unless the endpoint has rejected one before
+        results = None
+        if len(attempts) > 1 and self.batch_size > 1:
+            async with semaphore:
+                results = await self.query_batch([attempt[1:] for attempt in attempts])
+            if results is None and self.batch_size > 1:
+                self.batch_size = 1
+                print(f"{Fore.YELLOW}Endpoint rejected a batch request, sending single queries instead{Style.RESET_ALL}")
+        if results is None:
+            # Single queries take a slot each, so they still run concurrently
+            results = await asyncio.gather(
+                *(self._bounded_query(semaphore, path, data, height, prove) for _, path, data, height, prove in attempts)
+            )
+        
+        for (template_index, *probe), (success, response_time, _) in zip(attempts, results):
+            if success:
+                self._working_probes.add(tuple(probe))
+            self._record_attempt(template_index, success, response_time, max_attempts)
+    
+    def _new_attempt(self, template_index: int, height: str, prove: bool) -> Optional[Tuple[int, str, str, str, bool]]:
+        """
+        Fill in a probe that has not been sent recently, redrawing repeats
+        
+        Args:
+            template_index: Index of the randomly picked path template
+            height: Randomly picked block height
+            prove: Randomly picked prove value
+            
+        Returns:
+            Tuple of (template_index, path, data, height, prove), or None if
+            every redraw was a repeat
+        """
+        tried = self._tried_probes
+        for _ in range(MAX_PROBE_REDRAWS):
+            attempt = self._random_attempt(template_index, height, prove)
+            probe = attempt[1:]
+            if probe not in tried and probe not in self._working_probes:
+                tried[probe] = None
+                # Mark the template as tried once the attempt is accepted, so that later
+                # attempts only use the provided actor address for the first query of a template
+                self.stats["paths_tried"] |= 1 << template_index
+                if len(tried) > TRIED_PROBES_SIZE:
+                    tried.popitem(last=False)
+                return attempt
+            # Refresh the repeat, so that frequently drawn probes stay remembered
+            if probe in tried:
+                tried.move_to_end(probe)
+            template_index = random.choice(self._active_templates)
+            height = random.choice(QUERY_HEIGHTS)
+            prove = random.choice(PROVE_OPTIONS)
+        self.stats["skipped_probes"] += 1
+        return None
+    
+    async def _bounded_query(self, semaphore: asyncio.Semaphore, path: str, data: str, height: str,
+                             prove: bool) -> Tuple[bool, int, Any]:
+        """
+        Send a single ABCI query once a slot is free
+        
+        Args:
+            semaphore: Semaphore bounding the number of HTTP requests in flight
+            path: Query path
+            data: Base64 encoded data
+            height: Block height (0 for latest)
+            prove: Whether to include proofs
+            
+        Returns:
+            Tuple of (success, response_time_ns, response)
+        """
+        async with semaphore:
+            return await self.query(path, data, height, prove)
+    
+    def _record_attempt(self, template_index: int, success: bool, response_time: int, max_attempts: int):
+        """
+        Record the result of a query in the attempt log
+        
+        Only the counters needed for the progress output are updated per query,
+        the remaining statistics are computed from the log by _fold_attempts.
+        
+        Args:
+            template_index: Index of the path template that was queried
+            success: Whether the query succeeded
+            response_time: Response time in nanoseconds
+            max_attempts: Total number of attempts, for progress output
+        """
+        slot = self._attempts_recorded
+        self._attempts_recorded = slot + 1
+        self._attempt_templates[slot] = template_index
+        self._attempt_times[slot] = response_time
+        
+        if success:
+            self._attempt_successes[slot] = 1
+            self.stats["successful_queries"] += 1
+            self.stats["successful_paths"] |= 1 << template_index
+            print(f"{Fore.GREEN}✓ Working path found: {self.template_names[template_index]}{Style.RESET_ALL}")
+        
+        # Progress update, at most once per interval
+        now = time.monotonic()
+        if now - self._last_progress >= PROGRESS_INTERVAL:
+            self._last_progress = now
+            self._print_progress(max_attempts)
+    
+    def _print_progress(self, max_attempts: int):
+        """
+        Print the number of queries completed so far and the working paths found
+        
+        Args:
+            max_attempts: Total number of attempts
+        """
+        completed = self.stats["total_queries"] + self._attempts_recorded
+        success_rate = self.stats["successful_queries"] / max(1, completed) * 100
+        sys.stdout.write(f"{PROGRESS_PREFIX}{completed}/{max_attempts} queries, {bin(self.stats['successful_paths']).count('1')} "
+                         f"working paths found ({success_rate:.1f}% success rate){PROGRESS_SUFFIX}")
+    
+    def _reset_attempts(self, max_attempts: int):
+        """
+        Allocate the attempt log for a run
+        
+        Args:
+            max_attempts: Number of attempts in the run
+        """
+        self._attempt_templates = array("i", bytes(4 * max_attempts))
+        self._attempt_successes = bytearray(max_attempts)
+        self._attempt_times = array("q", bytes(8 * max_attempts))
+        self._attempts_recorded = 0
+        self._last_progress = time.monotonic()
+    
+    def _fold_attempts(self):
+        """Add the attempts logged in the run to the statistics"""
+        recorded = self._attempts_recorded
+        if not recorded:
+            return
+        templates = self._attempt_templates[:recorded]
+        successes = self._attempt_successes[:recorded]
+        times = self._attempt_times[:recorded]
+        
+        failed = recorded - sum(successes)
+        self.stats["total_queries"] += recorded
+        self.stats["failed_queries"] += failed
+        if failed:
+            failed_paths = self.stats["failed_paths"]
+            for template_index, success in zip(templates, successes):
+                if not success:
+                    failed_paths[template_index] += 1
+        
+        # Response time stats
+        fastest = min(times)
+        if self.stats["min_response_time_ns"] is None or fastest < self.stats["min_response_time_ns"]:
+            self.stats["min_response_time_ns"] = fastest
+        self.stats["max_response_time_ns"] = max(self.stats["max_response_time_ns"], max(times))
+        self.stats["total_response_time_ns"] += sum(times)
+        self._attempts_recorded = 0
+    
     async def discover_working_paths(self, max_attempts: int = 1000):
         """
         Try to discover working ABCI query paths
@@ -444,81 +939,57 @@ class ABCIQueryFuzzer:
         """
         print(f"{Fore.CYAN}Starting ABCI query path discovery...{Style.RESET_ALL}")
         
-        # Create session
+        # Create a session for this run, unless one is already open
+        owns_run_session = self.session is None
         await self.create_session()
+        if self.verbose:
+            self.verbose_log.start()
+        try:
+            await self._discover_working_paths(max_attempts)
+        finally:
+            await self.verbose_log.stop()
+            if owns_run_session:
+                await self.close_session()
+    
+    async def _discover_working_paths(self, max_attempts: int):
+        """
+        Validate the endpoint and run the path discovery on the open session
+        
+        Args:
+            max_attempts: Maximum number of query attempts
+        """
+        # Send all endpoint checks in one round trip if the endpoint takes batches
+        preflight = await self._preflight()
         
         # Validate that the endpoint is a Tendermint node
-        if not await self._validate_endpoint():
+        if not await self._validate_endpoint(preflight):
             print(f"{Fore.RED}Endpoint validation failed. Aborting path discovery.{Style.RESET_ALL}")
-            await self.close_session()
             return
         
         # Test if abci_query works at all
-        if not await self._test_direct_query():
+        if not await self._test_direct_query(preflight):
             print(f"{Fore.RED}The abci_query method is not supported by this endpoint. Aborting path discovery.{Style.RESET_ALL}")
-            await self.close_session()
             return
         
-        print(f"{Fore.CYAN}Trying up to {max_attempts} combinations of paths and parameters{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Trying up to {max_attempts} combinations of paths and parameters "
+              f"({self.concurrency} requests of {self.batch_size} queries at a time){Style.RESET_ALL}")
         
-        # Add simple paths that are likely to work
-        simple_paths = [
-            "/", 
-            "/app/info",
-            "/app/version",
-            "/info",
-            "/version",
-            "/store",
-            "/key",
-            "/custom",
-            "/p2p/filter/addr",
-            "/p2p/filter/id",
-            "/validators"
-        ]
-        
-        # Add them to the beginning of the path_templates
-        self.path_templates = simple_paths + self.path_templates
-        
-        for i in range(max_attempts):
-            # Select a random path
-            path_template = random.choice(self.path_templates)
-            path = self._replace_path_params(path_template)
-            
-            # Generate appropriate data
-            data = self._generate_data_for_path(path)
-            
-            # Random height and prove
-            height = self._get_random_height()
-            prove = self._get_random_prove()
-            
-            # Send query
-            success, response_time, response = await self.query(path, data, height, prove)
-            
-            # Update statistics
-            self.stats["total_queries"] += 1
-            self.stats["paths_tried"].add(path_template)
-            
-            if success:
-                self.stats["successful_queries"] += 1
-                self.stats["successful_paths"].add(path_template)
-                print(f"{Fore.GREEN}✓ Working path found: {path_template}{Style.RESET_ALL}")
-            else:
-                self.stats["failed_queries"] += 1
-                self.stats["failed_paths"][path_template] = self.stats["failed_paths"].get(path_template, 0) + 1
-            
-            # Update response time stats
-            if response_time < self.stats["min_response_time"]:
-                self.stats["min_response_time"] = response_time
-            if response_time > self.stats["max_response_time"]:
-                self.stats["max_response_time"] = response_time
-            self.stats["total_response_time"] += response_time
-            
-            # Progress update
-            if (i + 1) % 10 == 0:
-                success_rate = self.stats["successful_queries"] / self.stats["total_queries"] * 100
-                print(f"{Fore.CYAN}Progress: {i+1}/{max_attempts} queries, {len(self.stats['successful_paths'])} working paths found ({success_rate:.1f}% success rate){Style.RESET_ALL}")
+        # A fixed pool of workers takes the batches one after another, so a slow
+        # response only holds up its own worker instead of a whole round
+        semaphore = asyncio.Semaphore(self.concurrency)
+        batch_sizes = (min(self.batch_size, max_attempts - i) for i in range(0, max_attempts, self.batch_size))
+        self._reset_attempts(max_attempts)
+        workers = [asyncio.ensure_future(self._attempt_worker(semaphore, batch_sizes, max_attempts))
+                   for _ in range(self.concurrency)]
+        try:
+            await asyncio.gather(*workers)
+            self._print_progress(max_attempts)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self._fold_attempts()
         
-        await self.close_session()
         self._print_report()
     
     def _print_report(self):
@@ -538,11 +1009,13 @@ class ABCIQueryFuzzer:
         
         if self.stats["successful_paths"]:
             print(f"\n{Fore.GREEN}Working paths:{Style.RESET_ALL}")
-            for path in sorted(self.stats["successful_paths"]):
+            for path in sorted(self._templates_in(self.stats["successful_paths"])):
                 print(f"  {Fore.GREEN}✓{Style.RESET_ALL} {path}")
         
-        print(f"\n{Fore.CYAN}Paths tried: {len(self.stats['paths_tried'])}{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}Average response time: {self.stats['total_response_time']/max(1, self.stats['total_queries'])*1000:.2f} ms{Style.RESET_ALL}")
+        print(f"\n{Fore.CYAN}Paths tried: {bin(self.stats['paths_tried']).count('1')}{Style.RESET_ALL}")
+        if self.stats["skipped_probes"]:
+            print(f"{Fore.CYAN}Repeated probes skipped: {self.stats['skipped_probes']}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Average response time: {self.stats['total_response_time_ns']/max(1, self.stats['total_queries'])/1e6:.2f} ms{Style.RESET_ALL}")
         
         print(f"{Fore.CYAN}{'=' * terminal_width}{Style.RESET_ALL}")
 
@@ -555,5 +1028,13 @@ if __name__ == "__main__":
     # Initialize colorama
     colorama.init()
     
+    # Use the libuv-based event loop when available, like the storm command
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     # Run the fuzzer
     asyncio.run(main()) 
\ No newline at end of file
@@ -0,0 +1,18 @@
+"""
+Console setup for Storm
+"""
+
+_colors_initialized = False
+
+def init_colors():
+    """
+    Initialize colorama, once, the first time a test prints anything
+    
+    This is deferred from import time so that importing the testers, e.g.
+    to inspect their methods, does not wrap sys.stdout.
+    """
+    global _colors_initialized
+    if not _colors_initialized:
+        import colorama
+        colorama.init()
+        _colors_initialized = True
@@ -3,21 +3,60 @@ RPC flood testing module for Storm
 """
 
 import asyncio
+from collections import Counter
 import json
+from array import array
 import random
 import time
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import Dict, List, Any, Optional, Tuple, Union
 import aiohttp
-import uuid
-import colorama
 from colorama import Fore, Style
-from tqdm import tqdm
 import os
 import datetime
 from .ethereum_params import ParameterGenerator
+from . import json_utils
+from .console import init_colors
+from .failure_log import FailureLog
+from .log_buffer import LogBuffer
+from .progress import ProgressTicker
+from .rate_limiter import TokenBucket
+from .session import create_session
 
-# Initialize colorama
-colorama.init()
+# JSON-RPC request body prefix and suffix, the method name is filled in once per method
+_REQUEST_PREFIX = b'{"jsonrpc":"2.0","method":'
+_REQUEST_SUFFIX = b',"params":%b,"id":%d}'
+
+# Number of serialized parameter lists generated per method, must be a power of two
+PARAMS_POOL_SIZE = 4096
+
+def _request_template(method: str) -> bytes:
+    """
+    Build the JSON-RPC request template of a method
+    
+    Args:
+        method: The method to call
+        
+    Returns:
+        Request body with placeholders for the serialized params and the id
+    """
+    return _REQUEST_PREFIX + json_utils.dumps(method).replace(b"%", b"%%") + _REQUEST_SUFFIX
+
+def _params_pool(serialized_params: List[bytes]) -> Tuple[bytes, ...]:
+    """
+    Freeze a pool of serialized parameter lists for one method
+    
+    Most generators pick from a few short sample lists, so many entries
+    come out the same. Repeats share the first copy instead of each
+    keeping its own.
+    
+    Args:
+        serialized_params: Serialized parameter lists of the method
+        
+    Returns:
+        The serialized parameter lists
+    """
+    unique: Dict[bytes, bytes] = {}
+    return tuple(unique.setdefault(params, params) for params in serialized_params)
 
 class RPCFloodTester:
     """
@@ -29,20 +68,36 @@ class RPCFloodTester:
         url: str, 
         requests_per_second: int = 100, 
         methods: Optional[List[str]] = None,
-        verbose: bool = False
+        verbose: bool = False,
+        session: Optional[aiohttp.ClientSession] = None,
+        batch_size: int = 1,
+        rate_limiter: Optional[TokenBucket] = None,
+        log_interval: float = 1.0,
+        workers: Optional[int] = None
     ):
         self.url = url
         self.requests_per_second = requests_per_second
         self.methods = methods
         self.verbose = verbose
-        self.session = None
+        # Verbose output is buffered and printed once per log_interval seconds
+        self.verbose_log = LogBuffer(log_interval)
+        # Number of JSON-RPC calls packed into each HTTP request
+        self.batch_size = max(1, batch_size)
+        # An injected session is shared with the caller, who is responsible for closing it
+        self.session = session
+        self._owns_session = session is None
+        # Paces individual requests, otherwise the tester creates its own token bucket
+        self.rate_limiter = rate_limiter
+        # Number of request workers, each keeps one HTTP request in flight
+        self.workers = max(1, workers if workers is not None else -(-requests_per_second // self.batch_size))
         self.request_id = 0
         self.stats = {
             "total_requests": 0,
             "successful_requests": 0,
             "failed_requests": 0,
-            "errors_by_method": {},
-            "requests_by_method": {},
+            "errors_by_method": Counter(),
+            "requests_by_method": Counter(),
+            # Response times of successful requests in seconds, summarized when the run ends
             "min_response_time": float('inf'),
             "max_response_time": 0,
             "total_response_time": 0,
@@ -50,6 +105,9 @@ class RPCFloodTester:
             "unavailable_methods": [],
         }
         
+        # Response times of successful requests, recorded as the responses come in
+        self.response_times = array("q")
+        
         # Initialize parameter generator
         self.param_generator = ParameterGenerator()
         
@@ -64,20 +122,18 @@ class RPCFloodTester:
                 if method in methods
             }
         
-        # Create log directory if it doesn't exist
-        os.makedirs("logs", exist_ok=True)
+        # Request template and serialized parameter pool per method, looked up together
+        # once per request. The pools are built by run for the methods that turned out
+        # to be available, each request reuses an entry picked by its id, so only the id
+        # is formatted per request.
+        self._request_parts: Dict[str, Tuple[bytes, Tuple[bytes, ...]]] = {}
         
-        # Create a log file for failed requests
+        # Log file for failed requests, created when the test runs
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         self.log_file = f"logs/eth_failed_requests_{timestamp}.log"
         
-        # Log file header
-        with open(self.log_file, "w") as f:
-            f.write(f"# ETH RPC Failed Requests Log\n")
-            f.write(f"# Target: {url}\n")
-            f.write(f"# Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"# Methods: {', '.join(self.available_methods.keys()) if methods else 'All'}\n")
-            f.write(f"# Format: [timestamp] method | request | response/error\n\n")
+        # Failed requests are appended by a background writer, see FailureLog
+        self.failure_log = FailureLog(self.log_file)
         
         # Sample addresses, block hashes, and transaction hashes for testing
         self.sample_addresses = [
@@ -123,7 +179,20 @@ class RPCFloodTester:
             "0x0000000000000000",
         ]
 
-    async def _send_request(self, method: str) -> Tuple[bool, float]:
+    def _ensure_log_file(self):
+        """Create the log file for failed requests and write its header"""
+        # Create log directory if it doesn't exist
+        os.makedirs("logs", exist_ok=True)
+        
+        # Log file header
+        with open(self.log_file, "w") as f:
+            f.write(f"# ETH RPC Failed Requests Log\n")
+            f.write(f"# Target: {self.url}\n")
+            f.write(f"# Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write(f"# Methods: {', '.join(self.available_methods.keys()) if self.methods else 'All'}\n")
+            f.write(f"# Format: [timestamp] method | request | response/error\n\n")
+    
+    async def _send_request(self, method: str) -> Tuple[bool, int]:
         """
         Send a JSON-RPC request to the node
         
@@ -131,79 +200,261 @@ class RPCFloodTester:
             method: The method to call
             
         Returns:
-            Tuple of (success, response_time)
+            Tuple of (success, response_time_ns)
         """
-        # Generate parameters for the method
-        params_generator = self.available_methods[method]
-        params = params_generator()
-        
         # Create the JSON-RPC request
         self.request_id += 1
-        request = {
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params,
-            "id": self.request_id
-        }
+        request = self._encode_request(method, self.request_id)
         
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         try:
-            async with self.session.post(self.url, json=request) as response:
-                response_text = await response.text()
-                response_time = time.time() - start_time
+            async with self.session.post(self.url, data=request, headers=json_utils.JSON_HEADERS) as response:
+                # Parse the raw body, it is only decoded to text when it has to be shown
+                response_body = await response.read()
+                response_time = time.perf_counter_ns() - start_time
                 
                 if response.status == 200:
+                    # Most responses are results, they are recognized without parsing the body
+                    if not (__debug__ and self.verbose) and json_utils.is_result_object(response_body):
+                        return True, response_time
+                    
                     try:
-                        response_json = json.loads(response_text)
+                        response_json = json_utils.loads(response_body)
                         if "error" in response_json:
                             # Log failed request
                             self._log_failed_request(method, request, response_json)
-                            if self.verbose:
-                                print(f"\nError for method {method}: {response_json['error']}")
+                            if __debug__ and self.verbose:
+                                self.verbose_log.write(f"Error for method {method}: {response_json['error']}")
                             return False, response_time
                         else:
-                            if self.verbose:
-                                print(f"\nRequest: {json.dumps(request)}")
-                                print(f"Response: {response_text}")
+                            if __debug__ and self.verbose:
+                                self.verbose_log.write(b"Request: " + request)
+                                self.verbose_log.write(b"Response: " + response_body)
                             return True, response_time
-                    except json.JSONDecodeError:
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        response_text = response_body.decode(errors="replace")
                         # Log failed request
                         self._log_failed_request(method, request, f"Invalid JSON: {response_text}")
-                        if self.verbose:
-                            print(f"\nInvalid JSON response for method {method}: {response_text}")
+                        if __debug__ and self.verbose:
+                            self.verbose_log.write(f"Invalid JSON response for method {method}: {response_text}")
                         return False, response_time
                 else:
+                    response_text = response_body.decode(errors="replace")
                     # Log failed request
                     self._log_failed_request(method, request, f"HTTP {response.status}: {response_text}")
-                    if self.verbose:
-                        print(f"\nError for method {method}: {response.status} - {response_text}")
+                    if __debug__ and self.verbose:
+                        self.verbose_log.write(f"Error for method {method}: {response.status} - {response_text}")
                     return False, response_time
         
         except Exception as e:
             # Log failed request
             self._log_failed_request(method, request, f"Exception: {str(e)}")
-            if self.verbose:
-                print(f"\nException for method {method}: {str(e)}")
-            return False, time.time() - start_time
+            if __debug__ and self.verbose:
+                self.verbose_log.write(f"Exception for method {method}: {str(e)}")
+            return False, time.perf_counter_ns() - start_time
     
-    def _log_failed_request(self, method: str, request: Dict, error: Any):
+    def _encode_request(self, method: str, request_id: int) -> bytes:
+        """
+        Encode the JSON-RPC request body with parameters from the method's pool
+        
+        Methods without a pool yet, such as during the availability checks,
+        get freshly generated parameters.
+        
+        Args:
+            method: The method to call
+            request_id: The JSON-RPC request id
+            
+        Returns:
+            The serialized request
+        """
+        parts = self._request_parts.get(method)
+        if parts is None:
+            return _request_template(method) % (self.param_generator.generate_json_batch(method, 1)[0], request_id)
+        template, params_pool = parts
+        return template % (params_pool[request_id & (PARAMS_POOL_SIZE - 1)], request_id)
+    
+    def _build_request_parts(self):
+        """Generate and serialize the parameter pools of the available methods"""
+        for method in self.available_methods:
+            if method not in self._request_parts:
+                self._request_parts[method] = (
+                    _request_template(method),
+                    _params_pool(self.param_generator.generate_json_batch(method, PARAMS_POOL_SIZE)),
+                )
+    
+    async def _send_batch(self, methods: List[str]) -> Optional[List[Tuple[bool, int]]]:
+        """
+        Send several JSON-RPC requests to the node in a single batch request
+        
+        Args:
+            methods: The methods to call, one request per entry
+            
+        Returns:
+            List of (success, response_time_ns) tuples in the same order as methods,
+            or None if the node answered with a single error object because it does
+            not accept batches
+        """
+        requests = []
+        for method in methods:
+            self.request_id += 1
+            requests.append((method, self.request_id, self._encode_request(method, self.request_id)))
+        body = b"[" + b",".join(request for _, _, request in requests) + b"]"
+        
+        start_time = time.perf_counter_ns()
+        try:
+            async with self.session.post(self.url, data=body, headers=json_utils.JSON_HEADERS) as response:
+                response_body = await response.read()
+                response_time = time.perf_counter_ns() - start_time
+                
+                if response.status != 200:
+                    error = f"HTTP {response.status}: {response_body.decode(errors='replace')}"
+                    return self._fail_batch(requests, response_time, error)
+                try:
+                    response_json = json_utils.loads(response_body)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    error = f"Invalid JSON: {response_body.decode(errors='replace')}"
+                    return self._fail_batch(requests, response_time, error)
+                # A single error object means the node does not accept batches
+                if isinstance(response_json, dict) and "error" in response_json:
+                    return None
+                if not isinstance(response_json, list):
+                    error = f"Invalid batch response: {response_body.decode(errors='replace')}"
+                    return self._fail_batch(requests, response_time, error)
+        except Exception as e:
+            return self._fail_batch(requests, time.perf_counter_ns() - start_time, f"Exception: {str(e)}")
+        
+        # Batch responses may come back in any order, match them by id
+        responses = {item.get("id"): item for item in response_json if isinstance(item, dict)}
+        results = []
+        for method, request_id, request in requests:
+            item = responses.get(request_id)
+            if item is None:
+                self._log_failed_request(method, request, "Missing response in batch")
+                results.append((False, response_time))
+            elif "error" in item:
+                self._log_failed_request(method, request, item)
+                if __debug__ and self.verbose:
+                    self.verbose_log.write(f"Error for method {method}: {item['error']}")
+                results.append((False, response_time))
+            else:
+                if __debug__ and self.verbose:
+                    self.verbose_log.write(b"Request: " + request)
+                    self.verbose_log.write(b"Response: " + json_utils.dumps(item))
+                results.append((True, response_time))
+        return results
+    
+    def _fail_batch(self, requests: List[Tuple[str, int, bytes]], response_time: int,
+                    error: str) -> List[Tuple[bool, int]]:
+        """
+        Log every request of a failed batch and return their failed results
+        
+        Args:
+            requests: Tuples of (method, request_id, request) of the batch
+            response_time: Response time of the batch in nanoseconds
+            error: Description of the failure
+            
+        Returns:
+            List of (False, response_time) tuples, one per request
+        """
+        for method, _, request in requests:
+            self._log_failed_request(method, request, error)
+        if __debug__ and self.verbose:
+            self.verbose_log.write(f"Error for batch of {len(requests)} requests: {error}")
+        return [(False, response_time)] * len(requests)
+    
+    async def _produce_requests(self, queue: asyncio.Queue, rate_limiter: TokenBucket, method_choices: Tuple[str, ...]):
+        """
+        Queue batches of random methods, taking a token from the rate limiter per method
+        
+        Args:
+            queue: Queue consumed by the workers
+            rate_limiter: Token bucket pacing the requests
+            method_choices: Methods to pick from
+        """
+        while True:
+            # Draw methods in chunks rather than calling random.choice per request
+            batch_size = self.batch_size
+            chosen = random.choices(method_choices, k=256 * batch_size)
+            for i in range(0, len(chosen), batch_size):
+                methods = chosen[i:i + batch_size]
+                await rate_limiter.acquire(len(methods))
+                await queue.put(methods)
+    
+    async def _worker(self, queue: asyncio.Queue):
+        """
+        Send requests for queued batches of methods until cancelled
+        
+        Args:
+            queue: Queue of method batches to call
+        """
+        while True:
+            methods = await queue.get()
+            try:
+                self.stats["requests_by_method"].update(methods)
+                
+                # The send methods catch their own exceptions
+                results = None
+                if len(methods) > 1:
+                    results = await self._send_batch(methods)
+                    if results is None and self.batch_size > 1:
+                        # Fall back to single requests for the rest of the run
+                        self.batch_size = 1
+                        print(f"\n{Fore.YELLOW}Node rejected a batch request, sending single requests instead{Style.RESET_ALL}")
+                
+                if results is None:
+                    results = [await self._send_request(method) for method in methods]
+                
+                self._record_results(methods, results)
+            finally:
+                queue.task_done()
+    
+    def _record_results(self, methods: List[str], results: List[Tuple[bool, int]]):
+        """
+        Update the statistics with the results of one HTTP request
+        
+        The batch is tallied in local variables and added to the stats once.
+        
+        Args:
+            methods: The methods that were called
+            results: Tuples of (success, response_time_ns) in the same order as methods
+        """
+        record_response_time = self.response_times.append
+        failed = []
+        for method, (success, response_time) in zip(methods, results):
+            if success:
+                record_response_time(response_time)
+            else:
+                failed.append(method)
+        
+        self.stats["total_requests"] += len(results)
+        self.stats["successful_requests"] += len(results) - len(failed)
+        if failed:
+            self.stats["failed_requests"] += len(failed)
+            self.stats["errors_by_method"].update(failed)
+    
+    def _summarize_response_times(self):
+        """Fill the response time statistics, in seconds, from the recorded response times"""
+        if self.response_times:
+            self.stats["min_response_time"] = min(self.response_times) / 1e9
+            self.stats["max_response_time"] = max(self.response_times) / 1e9
+            self.stats["total_response_time"] = sum(self.response_times) / 1e9
+    
+    def _log_failed_request(self, method: str, request: Union[Dict, bytes], error: Any):
         """
         Log a failed request to the log file
         
         Args:
             method: The method that failed
-            request: The request that was sent
+            request: The request that was sent, either as a dict or its serialized body
             error: The error response or exception
         """
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with open(self.log_file, "a") as f:
-            f.write(f"[{timestamp}] {method}\n")
-            f.write(f"Request: {json.dumps(request, indent=2)}\n")
-            f.write(f"Error: {json.dumps(error, indent=2) if isinstance(error, dict) else str(error)}\n")
-            f.write("-" * 80 + "\n\n")
+        self.failure_log.write(method, request, error)
 
     async def _test_method_availability(self):
         """Test which methods are available"""
+        # Only needed for this progress bar, so it is imported here
+        from tqdm import tqdm
+        
         available_methods = []
         unavailable_methods = []
         
@@ -230,14 +481,20 @@ class RPCFloodTester:
         Returns:
             Statistics about the run
         """
+        init_colors()
+        self._ensure_log_file()
+        
         print(f"{Fore.CYAN}Starting RPC flood testing against {Fore.YELLOW}{self.url}{Style.RESET_ALL}")
         print(f"{Fore.CYAN}Requests per second: {Fore.YELLOW}{self.requests_per_second}{Style.RESET_ALL}")
         print(f"{Fore.CYAN}Duration: {Fore.YELLOW}{duration} seconds{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Workers: {Fore.YELLOW}{self.workers}{Style.RESET_ALL}")
         print(f"{Fore.CYAN}Methods: {Fore.YELLOW}{', '.join(self.available_methods.keys()) if self.methods else 'All'}{Style.RESET_ALL}")
         print(f"{Fore.CYAN}Failed requests will be logged to: {Fore.YELLOW}{self.log_file}{Style.RESET_ALL}")
         print(f"{Fore.CYAN}Press Ctrl+C to stop{Style.RESET_ALL}\n")
         
-        self.session = aiohttp.ClientSession()
+        if self.session is None:
+            self.session = create_session(self.requests_per_second)
+        self.failure_log.start()
         
         # Test which methods are available before starting the flood testing
         print(f"{Fore.CYAN}Testing method availability...{Style.RESET_ALL}")
@@ -245,7 +502,9 @@ class RPCFloodTester:
         
         if not self.stats["available_methods"]:
             print(f"{Fore.RED}No methods available. Exiting.{Style.RESET_ALL}")
-            await self.session.close()
+            await self.failure_log.stop()
+            if self._owns_session:
+                await self.session.close()
             return self.stats
             
         print(f"{Fore.GREEN}Available methods: {Fore.YELLOW}{', '.join(self.stats['available_methods'])}{Style.RESET_ALL}")
@@ -258,77 +517,67 @@ class RPCFloodTester:
             for method, params_generator in self.available_methods.items() 
             if method in self.stats["available_methods"]
         }
+        self._build_request_parts()
+        # Fixed sequence to draw the methods from
+        method_choices = tuple(self.available_methods)
         
         # Record start time
         self.stats["start_time"] = time.time()
         end_time = self.stats["start_time"] + duration
         
-        # Create a progress bar
-        with tqdm(total=duration, desc="Testing progress", unit="s") as pbar:
+        if self.verbose:
+            self.verbose_log.start()
+        
+        # Requests are paced by the token bucket and sent by a fixed pool of workers,
+        # a slow response only holds up its own worker while the others keep sending
+        rate_limiter = self.rate_limiter or TokenBucket(self.requests_per_second)
+        rate_limiter.start()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.workers)
+        pacer = asyncio.ensure_future(self._produce_requests(queue, rate_limiter, method_choices))
+        workers = [asyncio.ensure_future(self._worker(queue)) for _ in range(self.workers)]
+        
+        # Progress is printed once per second from its own task
+        progress = ProgressTicker(duration, self.stats)
+        progress.start()
+        try:
             try:
-                while time.time() < end_time:
-                    start_loop = time.time()
-                    
-                    # Create tasks for this batch
-                    tasks = []
-                    methods_for_this_batch = []
-                    
-                    for _ in range(self.requests_per_second):
-                        # Select a random method
-                        method = random.choice(list(self.available_methods.keys()))
-                        methods_for_this_batch.append(method)
-                        tasks.append(self._send_request(method))
-                    
-                    # Execute tasks
-                    results = await asyncio.gather(*tasks, return_exceptions=True)
-                    
-                    # Update statistics
-                    for result, method in zip(results, methods_for_this_batch):
-                        self.stats["total_requests"] += 1
-                        self.stats["requests_by_method"][method] = self.stats["requests_by_method"].get(method, 0) + 1
-                        
-                        if isinstance(result, Exception):
-                            self.stats["failed_requests"] += 1
-                            self.stats["errors_by_method"][method] = self.stats["errors_by_method"].get(method, 0) + 1
-                            # Log failed request
-                            self._log_failed_request(method, {"method": method, "error": str(result)}, f"Exception: {str(result)}")
-                            if self.verbose:
-                                print(f"{Fore.RED}Error in {method}: {str(result)}{Style.RESET_ALL}")
-                        else:
-                            success, response_time = result
-                            if success:
-                                self.stats["successful_requests"] += 1
-                                self.stats["total_response_time"] += response_time
-                                if response_time < self.stats["min_response_time"]:
-                                    self.stats["min_response_time"] = response_time
-                                if response_time > self.stats["max_response_time"]:
-                                    self.stats["max_response_time"] = response_time
-                            else:
-                                self.stats["failed_requests"] += 1
-                                self.stats["errors_by_method"][method] = self.stats["errors_by_method"].get(method, 0) + 1
-                    
-                    # Sleep to maintain the requests per second rate
-                    elapsed = time.time() - start_loop
-                    if elapsed < 1.0:
-                        await asyncio.sleep(1.0 - elapsed)
-                    
-                    # Update progress bar
-                    pbar.update(1)
-            
-            except KeyboardInterrupt:
+                await asyncio.sleep(max(0.0, end_time - time.time()))
+            except (asyncio.CancelledError, KeyboardInterrupt) as e:
+                # Ctrl+C only ends the test early, what is in flight is still recorded for the report
                 print(f"\n{Fore.YELLOW}Test interrupted by user.{Style.RESET_ALL}")
+                # The cancellation is handled here, so withdraw it from the task, or later
+                # timeouts in the same task would see it as still pending (Python 3.11+)
+                task = asyncio.current_task()
+                if isinstance(e, asyncio.CancelledError) and hasattr(task, "uncancel"):
+                    task.uncancel()
+            
+            # Stop producing, then let the workers send what is already queued
+            pacer.cancel()
+            await queue.join()
+        finally:
+            pacer.cancel()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(pacer, *workers, return_exceptions=True)
+            if self.rate_limiter is None:
+                await rate_limiter.stop()
+            await progress.stop()
+            await self.verbose_log.stop()
         
         # Record end time
         self.stats["end_time"] = time.time()
         
         # Calculate average response time
+        self._summarize_response_times()
         if self.stats["successful_requests"] > 0:
             self.stats["avg_response_time"] = self.stats["total_response_time"] / self.stats["successful_requests"]
         else:
             self.stats["avg_response_time"] = 0
         
-        # Close the session
-        await self.session.close()
+        # Write out the remaining failed requests and close the session
+        await self.failure_log.stop()
+        if self._owns_session:
+            await self.session.close()
         
         # Print report
         self._print_report()
@@ -363,57 +612,3 @@ class RPCFloodTester:
                 print(f"  {method}: {error_color}{errors} errors ({error_rate:.1f}%){Style.RESET_ALL}")
         
         print(f"{Fore.CYAN}{'=' * terminal_width}{Style.RESET_ALL}")
-    
-    async def _send_random_request(self) -> None:
-        """
-        Send a random JSON-RPC request to the node
-        """
-        # Select a random method
-        method = random.choice(list(self.available_methods.keys()))
-        
-        # Generate parameters for the method
-        params_generator = self.available_methods[method]
-        params = params_generator()
-        
-        # Create the JSON-RPC request
-        self.request_id += 1
-        request = {
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params,
-            "id": self.request_id
-        }
-        
-        start_time = time.time()
-        try:
-            async with self.session.post(self.url, json=request) as response:
-                response_text = await response.text()
-                response_time = time.time() - start_time
-                
-                self.stats["total_requests"] += 1
-                self.stats["total_response_time"] += response_time
-                
-                if response.status == 200:
-                    self.stats["successful_requests"] += 1
-                    if self.verbose:
-                        print(f"\nRequest: {json.dumps(request)}")
-                        print(f"Response: {response_text}")
-                else:
-                    self.stats["failed_requests"] += 1
-                    if method not in self.stats["errors_by_method"]:
-                        self.stats["errors_by_method"][method] = 0
-                    self.stats["errors_by_method"][method] += 1
-                    
-                    if self.verbose:
-                        print(f"\nError for method {method}: {response.status} - {response_text}")
-        
-        except Exception as e:
-            self.stats["total_requests"] += 1
-            self.stats["failed_requests"] += 1
-            
-            if method not in self.stats["errors_by_method"]:
-                self.stats["errors_by_method"][method] = 0
-            self.stats["errors_by_method"][method] += 1
-            
-            if self.verbose:
-                print(f"\nException for method {method}: {str(e)}")
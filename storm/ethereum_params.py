@@ -2,187 +2,297 @@
 Parameter generators for Ethereum JSON-RPC API fuzzing
 """
 
+import itertools
 import random
 from typing import List, Any, Callable, Dict
 
+from . import json_utils
+
+# Gas limit range of random eth_call transactions
+_CALL_GAS_RANGE = (21000, 1000000)
+
+# Possible gas prices (1-100 Gwei) and values (0-10 ETH) of random eth_call
+# transactions, few enough to be formatted once up front
+_CALL_GAS_PRICES = tuple(f"0x{gwei * 10**9:x}" for gwei in range(1, 101))
+_CALL_VALUES = tuple(f"0x{eth * 10**18:x}" for eth in range(0, 11))
+
+# Transaction (0-500) and uncle (0-10) indices of the index lookups, formatted once
+_TX_INDICES = tuple(f"0x{index:x}" for index in range(501))
+_UNCLE_INDICES = _TX_INDICES[:11]
+
+# Parameters of the methods that take none, shared by all calls and never modified
+_NO_PARAMS: List[Any] = []
+
+# Sample addresses, block hashes, transaction hashes and other values for fuzzing
+SAMPLE_ADDRESSES = (
+    # Standard addresses
+    "0x742d35Cc6634C0532925a3b844Bc454e4438f44e",
+    "0xd8dA6BF26964aF9D7eEd9e03E53415D37aA96045",  # vitalik.eth
+    "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",  # WETH
+    "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",  # USDC
+    "0x0000000000000000000000000000000000000000",  # Zero address
+
+    # Edge cases
+    "0xFFfFfFffFFfffFFfFFfFFFFFffFFFffffFfFFFfF",  # Max address
+    "0x000000000000000000000000000000000000dEaD",  # Dead address
+    "0x1",  # Too short
+    "0x" + "f" * 40,  # All Fs
+    "0x" + "a" * 39 + "g",  # Invalid hex character
+    "0x" + "a" * 100,  # Too long
+    "0xéàçñ",  # Non-ASCII characters
+    "0xabcdefABCDEF1234567890abcdefABCDEF12345678",  # Non-checksummed
+)
+
+SAMPLE_BLOCK_HASHES = (
+    # Standard block hashes
+    "0xd4e56740f876aef8c010b86a40d5f56745a118d0906a34e69aec8c0db1cb8fa3",  # Genesis block
+    "0x88e96d4537bea4d9c05d12549907b32561d3bf31f45aae734cdc119f13406cb6",
+    "0xb495a1d7e6663152ae92708da4843337b958146015a2802f4193a410044698c9",
+    "0x0000000000000000000000000000000000000000000000000000000000000000",  # Invalid hash
+
+    # Edge cases
+    "0x" + "f" * 64,  # All Fs
+    "0x1",  # Too short
+    "0x" + "a" * 63 + "g",  # Invalid hex character
+    "0x" + "a" * 128,  # Too long
+)
+
+SAMPLE_TX_HASHES = (
+    # Standard transaction hashes
+    "0x5c504ed432cb51138bcf09aa5e8a410dd4a1e204ef84bfed1be16dfba1b22060",
+    "0x2cc6c94c21685b7e0f8ddabf277a5ccf98db157c62619cde8baea696a74ed18e",
+    "0x0000000000000000000000000000000000000000000000000000000000000000",  # Invalid hash
+
+    # Edge cases
+    "0x" + "f" * 64,  # All Fs
+    "0x1",  # Too short
+    "0x" + "a" * 63 + "g",  # Invalid hex character
+    "0x" + "a" * 128,  # Too long
+    "",  # Empty string
+)
+
+SAMPLE_BLOCK_NUMBERS = (
+    # Standard block specifiers
+    "0x0",  # Genesis block
+    "0x1",  # Block 1
+    "0xa",  # Block 10
+    "0x100",  # Block 256
+    "0x1000000",  # Block 16777216
+    "latest",
+    "pending",
+    "earliest",
+    "safe",
+    "finalized",
+
+    # Edge cases
+    "0xffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff",  # Max uint256
+    "-0x1",  # Negative (invalid)
+    "-1",  # Negative decimal (invalid)
+    "0",  # Decimal 0
+    "1",  # Decimal 1
+    "18446744073709551615",  # Max uint64 as decimal
+    "18446744073709551616",  # Max uint64+1 as decimal
+    "0x" + "f" * 100,  # Too long hex
+    "9" * 78,  # Very large decimal (more than 2^256)
+    "0x0000000000000000000000000000000000000000000000000000000000000000",  # Padded 0
+    "unknown",  # Invalid string
+    "LATEST",  # Case variation
+    "0x" + "g",  # Invalid hex character
+    "",  # Empty string
+)
+
+SAMPLE_FILTER_IDS = (
+    # Standard filter IDs
+    "0x1",
+    "0x2",
+    "0x3",
+    "0x0",
+    "0x10",
+    "0x100",
+
+    # Edge cases
+    "0xffffffffffffffff",  # Max filter ID
+    "0x0000000000000000",  # Padded 0
+    "0x" + "f" * 32,  # Very long
+    "0x" + "0" * 32,  # Very long zeros
+    "-0x1",  # Negative (invalid)
+    "1",  # Decimal
+    "0",  # Zero decimal
+    "0xg",  # Invalid hex
+    "",  # Empty string
+)
+
+# Add sample gas prices with edge cases
+SAMPLE_GAS_PRICES = (
+    "0x1",  # Minimal
+    "0x3b9aca00",  # 1 Gwei
+    "0x174876e800",  # 100 Gwei
+    "0x9184e72a000",  # 10,000 Gwei
+    "0xffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff",  # Max uint256
+    "0x0",  # Zero
+    "0x" + "f" * 100,  # Too long
+)
+
+# Add sample gas limits with edge cases
+SAMPLE_GAS_LIMITS = (
+    "0x5208",  # 21000 (minimum for transfers)
+    "0x15f90",  # 90000
+    "0x186a0",  # 100000
+    "0x989680",  # 10000000
+    "0x1dcd6500",  # 500000000
+    "0xffffffff",  # 2^32 - 1
+    "0xffffffffffffffff",  # 2^64 - 1
+    "0xffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff",  # 2^256 - 1
+    "0x1",  # 1 (too low)
+    "0x0",  # 0 (invalid)
+)
+
+# Add sample values with edge cases
+SAMPLE_VALUES = (
+    "0x0",  # 0 ETH
+    "0x1",  # 1 wei
+    "0x56bc75e2d63100000",  # 100 ETH
+    "0xde0b6b3a7640000",  # 1 ETH
+    "0x6f05b59d3b20000",  # 0.5 ETH
+    "0xffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff",  # Max uint256
+    "0x" + "f" * 100,  # Too long
+)
+
+# Add sample indices with edge cases
+SAMPLE_INDICES = (
+    "0x0",  # First index
+    "0x1",  # Second index
+    "0xa",  # 10th index
+    "0x100",  # 256th index
+    "0xffffffff",  # 2^32 - 1
+    "0xffffffffffffffff",  # 2^64 - 1
+    "0xffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff",  # 2^256 - 1
+    "-0x1",  # Negative (invalid)
+    "0",  # Decimal 0
+    "1000000",  # Large decimal
+)
+
+# Sample CIDs for data params
+SAMPLE_DATA = (
+    "0x",  # Empty data
+    "0x00",  # Single byte
+    "0x01",  # Single byte
+    "0xabcd",  # Short data
+    "0x" + "0123456789abcdef" * 10,  # Medium data (~160 bytes)
+    "0x" + "deadbeef" * 100,  # Large data (~800 bytes)
+    "0x" + "ff" * 1024,  # Very large data (1KB)
+    "0x" + "00" * 1024,  # 1KB of zeros
+    "0x" + "ff" * 10000,  # Extremely large data (10KB)
+)
+
+
+def _random_hex(num_bytes: int) -> str:
+    """
+    Generate a random 0x-prefixed hex string
+    
+    All digits come from a single getrandbits call instead of one
+    random.choice call per hex digit.
+    
+    Args:
+        num_bytes: Number of random bytes, the string has two digits per byte
+        
+    Returns:
+        Hex string with exactly 2 * num_bytes digits after the prefix
+    """
+    return "0x%0*x" % (num_bytes * 2, random.getrandbits(num_bytes * 8))
+
+
+def _random_hex_list(num_bytes: int, count: int) -> List[str]:
+    """
+    Generate several random 0x-prefixed hex strings of the same length
+    
+    The digits of all strings come from a single getrandbits call and are
+    cut into strings of 2 * num_bytes digits.
+    
+    Args:
+        num_bytes: Number of random bytes per string
+        count: Number of strings
+        
+    Returns:
+        List of count hex strings
+    """
+    width = num_bytes * 2
+    digits = "%0*x" % (width * count, random.getrandbits(num_bytes * 8 * count))
+    return ["0x" + digits[i:i + width] for i in range(0, width * count, width)]
+
 
 class ParameterGenerator:
     """
     Generates parameters for Ethereum JSON-RPC API methods
     """
     
+    # The generators read the sample lists on every call, slots make those lookups direct
+    __slots__ = (
+        "sample_addresses",
+        "sample_block_hashes",
+        "sample_tx_hashes",
+        "sample_block_numbers",
+        "sample_filter_ids",
+        "sample_gas_prices",
+        "sample_gas_limits",
+        "sample_values",
+        "sample_indices",
+        "sample_data",
+        "_address_selections",
+        "_sampled_params",
+        "_batch_generators",
+        "_methods",
+    )
+    
     def __init__(self):
-        # Sample addresses, block hashes, and transaction hashes for fuzzing
-        self.sample_addresses = [
-            # Standard addresses
-            "0x742d35Cc6634C0532925a3b844Bc454e4438f44e",
-            "0xd8dA6BF26964aF9D7eEd9e03E53415D37aA96045",  # vitalik.eth
-            "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",  # WETH
-            "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",  # USDC
-            "0x0000000000000000000000000000000000000000",  # Zero address
-            
-            # Edge cases
-            "0xFFfFfFffFFfffFFfFFfFFFFFffFFFffffFfFFFfF",  # Max address
-            "0x000000000000000000000000000000000000dEaD",  # Dead address
-            "0x1",  # Too short
-            "0x" + "f" * 40,  # All Fs
-            "0x" + "0" * 40,  # All 0s
-            "0x" + "a" * 39 + "g",  # Invalid hex character
-            "0x" + "a" * 100,  # Too long
-            "0xéàçñ",  # Non-ASCII characters
-            "0xabcdefABCDEF1234567890abcdefABCDEF12345678",  # Non-checksummed
-        ]
-        
-        self.sample_block_hashes = [
-            # Standard block hashes
-            "0xd4e56740f876aef8c010b86a40d5f56745a118d0906a34e69aec8c0db1cb8fa3",  # Genesis block
-            "0x88e96d4537bea4d9c05d12549907b32561d3bf31f45aae734cdc119f13406cb6",
-            "0xb495a1d7e6663152ae92708da4843337b958146015a2802f4193a410044698c9",
-            "0x0000000000000000000000000000000000000000000000000000000000000000",  # Invalid hash
-            
-            # Edge cases
-            "0x" + "f" * 64,  # All Fs
-            "0x" + "0" * 64,  # All 0s
-            "0x1",  # Too short
-            "0x" + "a" * 63 + "g",  # Invalid hex character
-            "0x" + "a" * 128,  # Too long
-        ]
-        
-        self.sample_tx_hashes = [
-            # Standard transaction hashes
-            "0x5c504ed432cb51138bcf09aa5e8a410dd4a1e204ef84bfed1be16dfba1b22060",
-            "0x2cc6c94c21685b7e0f8ddabf277a5ccf98db157c62619cde8baea696a74ed18e",
-            "0x0000000000000000000000000000000000000000000000000000000000000000",  # Invalid hash
-            
-            # Edge cases
-            "0x" + "f" * 64,  # All Fs
-            "0x" + "0" * 64,  # All 0s
-            "0x1",  # Too short
-            "0x" + "a" * 63 + "g",  # Invalid hex character
-            "0x" + "a" * 128,  # Too long
-            "",  # Empty string
-        ]
-        
-        self.sample_block_numbers = [
-            # Standard block specifiers
-            "0x0",  # Genesis block
-            "0x1",  # Block 1
-            "0xa",  # Block 10
-            "0x100",  # Block 256
-            "0x1000000",  # Block 16777216
-            "latest",
-            "pending",
-            "earliest",
-            "safe",
-            "finalized",
-            
-            # Edge cases
-            "0xffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff",  # Max uint256
-            "-0x1",  # Negative (invalid)
-            "-1",  # Negative decimal (invalid)
-            "0",  # Decimal 0
-            "1",  # Decimal 1
-            "18446744073709551615",  # Max uint64 as decimal
-            "18446744073709551616",  # Max uint64+1 as decimal
-            "0x" + "f" * 100,  # Too long hex
-            "9" * 78,  # Very large decimal (more than 2^256)
-            "0x0000000000000000000000000000000000000000000000000000000000000000",  # Padded 0
-            "unknown",  # Invalid string
-            "LATEST",  # Case variation
-            "0x" + "g",  # Invalid hex character
-            "",  # Empty string
-        ]
-        
-        self.sample_filter_ids = [
-            # Standard filter IDs
-            "0x1",
-            "0x2",
-            "0x3",
-            "0x0",
-            "0x10",
-            "0x100",
-            
-            # Edge cases
-            "0xffffffffffffffff",  # Max filter ID
-            "0x0000000000000000",  # Padded 0
-            "0x" + "f" * 32,  # Very long
-            "0x" + "0" * 32,  # Very long zeros
-            "-0x1",  # Negative (invalid)
-            "1",  # Decimal
-            "0",  # Zero decimal
-            "0xg",  # Invalid hex
-            "",  # Empty string
-        ]
-        
-        # Add sample gas prices with edge cases
-        self.sample_gas_prices = [
-            "0x1",  # Minimal
-            "0x3b9aca00",  # 1 Gwei
-            "0x3b9aca00",  # 1 Gwei
-            "0x174876e800",  # 100 Gwei
-            "0x9184e72a000",  # 10,000 Gwei
-            "0xffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff",  # Max uint256
-            "0x0",  # Zero
-            "0x" + "f" * 100,  # Too long
-        ]
+        # Sample values, shared by all generators
+        self.sample_addresses = SAMPLE_ADDRESSES
+        self.sample_block_hashes = SAMPLE_BLOCK_HASHES
+        self.sample_tx_hashes = SAMPLE_TX_HASHES
+        self.sample_block_numbers = SAMPLE_BLOCK_NUMBERS
+        self.sample_filter_ids = SAMPLE_FILTER_IDS
+        self.sample_gas_prices = SAMPLE_GAS_PRICES
+        self.sample_gas_limits = SAMPLE_GAS_LIMITS
+        self.sample_values = SAMPLE_VALUES
+        self.sample_indices = SAMPLE_INDICES
+        self.sample_data = SAMPLE_DATA
         
-        # Add sample gas limits with edge cases
-        self.sample_gas_limits = [
-            "0x5208",  # 21000 (minimum for transfers)
-            "0x15f90",  # 90000
-            "0x186a0",  # 100000
-            "0x989680",  # 10000000
-            "0x1dcd6500",  # 500000000
-            "0xffffffff",  # 2^32 - 1
-            "0xffffffffffffffff",  # 2^64 - 1
-            "0xffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff",  # 2^256 - 1
-            "0x1",  # 1 (too low)
-            "0x0",  # 0 (invalid)
-        ]
+        # Every ordered selection of 1 to 3 distinct addresses, for the address lists of
+        # eth_newFilter. Picking one is the same draw as random.sample without its copying.
+        self._address_selections = {
+            count: tuple(itertools.permutations(self.sample_addresses, count)) for count in range(1, 4)
+        }
         
-        # Add sample values with edge cases
-        self.sample_values = [
-            "0x0",  # 0 ETH
-            "0x1",  # 1 wei
-            "0x56bc75e2d63100000",  # 100 ETH
-            "0xde0b6b3a7640000",  # 1 ETH
-            "0x6f05b59d3b20000",  # 0.5 ETH
-            "0xffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff",  # Max uint256
-            "0x" + "f" * 100,  # Too long
-        ]
+        # Methods whose parameters are independent picks from the sample lists,
+        # with the options for each parameter in order
+        self._sampled_params = {
+            "eth_getBalance": (self.sample_addresses, self.sample_block_numbers),
+            "eth_getTransactionCount": (self.sample_addresses, self.sample_block_numbers),
+            "eth_getBlockTransactionCountByHash": (self.sample_block_hashes,),
+            "eth_getBlockTransactionCountByNumber": (self.sample_block_numbers,),
+            "eth_getUncleCountByBlockHash": (self.sample_block_hashes,),
+            "eth_getUncleCountByBlockNumber": (self.sample_block_numbers,),
+            "eth_getCode": (self.sample_addresses, self.sample_block_numbers),
+            "eth_getBlockByHash": (self.sample_block_hashes, (True, False)),
+            "eth_getBlockByNumber": (self.sample_block_numbers, (True, False)),
+            "eth_getTransactionByHash": (self.sample_tx_hashes,),
+            "eth_getTransactionByBlockHashAndIndex": (self.sample_block_hashes, _TX_INDICES),
+            "eth_getTransactionByBlockNumberAndIndex": (self.sample_block_numbers, _TX_INDICES),
+            "eth_getTransactionReceipt": (self.sample_tx_hashes,),
+            "eth_getUncleByBlockHashAndIndex": (self.sample_block_hashes, _UNCLE_INDICES),
+            "eth_getUncleByBlockNumberAndIndex": (self.sample_block_numbers, _UNCLE_INDICES),
+            "eth_uninstallFilter": (self.sample_filter_ids,),
+            "eth_getFilterChanges": (self.sample_filter_ids,),
+            "eth_getFilterLogs": (self.sample_filter_ids,),
+        }
         
-        # Add sample indices with edge cases
-        self.sample_indices = [
-            "0x0",  # First index
-            "0x1",  # Second index
-            "0xa",  # 10th index
-            "0x100",  # 256th index
-            "0xffffffff",  # 2^32 - 1
-            "0xffffffffffffffff",  # 2^64 - 1
-            "0xffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff",  # 2^256 - 1
-            "-0x1",  # Negative (invalid)
-            "0",  # Decimal 0
-            "1000000",  # Large decimal
-        ]
+        # Methods that generate a whole batch of their parameters at once
+        self._batch_generators = {
+            "eth_getStorageAt": self._generate_eth_getStorageAt_batch,
+        }
         
-        # Sample CIDs for data params
-        self.sample_data = [
-            "0x",  # Empty data
-            "0x00",  # Single byte
-            "0x01",  # Single byte
-            "0xabcd",  # Short data
-            "0x" + "0123456789abcdef" * 10,  # Medium data (~160 bytes)
-            "0x" + "deadbeef" * 100,  # Large data (~800 bytes)
-            "0x" + "ff" * 1024,  # Very large data (1KB)
-            "0x" + "00" * 1024,  # 1KB of zeros
-            "0x" + "ff" * 10000,  # Extremely large data (10KB)
-        ]
-    
-    def get_available_methods(self) -> Dict[str, Callable[[], List[Any]]]:
-        """
-        Returns a dictionary of available methods and their parameter generators
-        """
-        return {
+        # Parameter generator of every method
+        self._methods = {
             # Web3 Namespace
             "web3_clientVersion": self._generate_no_params,
             "web3_sha3": self._generate_web3_sha3_params,
@@ -227,10 +337,71 @@ class ParameterGenerator:
             "eth_getFilterLogs": self._generate_eth_getFilterLogs_params,
         }
     
+    def generate_batch(self, method: str, count: int) -> List[List[Any]]:
+        """
+        Generate the parameters for many calls of a method at once
+        
+        For methods that only pick from the sample lists, each parameter is
+        drawn for the whole batch with one random.choices call. Some other
+        methods have a batch generator of their own, methods without parameters
+        share one empty list, and the rest call their generator once per
+        parameter list.
+        
+        Args:
+            method: The method to generate parameters for
+            count: Number of parameter lists
+            
+        Returns:
+            List of count parameter lists
+        """
+        options = self._sampled_params.get(method)
+        if options is None:
+            batch_generator = self._batch_generators.get(method)
+            if batch_generator is not None:
+                return batch_generator(count)
+            params_generator = self._methods[method]
+            if params_generator == self._generate_no_params:
+                return [_NO_PARAMS] * count
+            return [params_generator() for _ in range(count)]
+        return [list(params) for params in zip(*(random.choices(choices, k=count) for choices in options))]
+    
+    def generate_json_batch(self, method: str, count: int) -> List[bytes]:
+        """
+        Generate the serialized parameters for many calls of a method at once
+        
+        For methods that only pick from the sample lists, every option is
+        serialized once and the picks are joined into JSON arrays without
+        building the parameter lists. Other methods serialize the lists
+        from generate_batch.
+        
+        Args:
+            method: The method to generate parameters for
+            count: Number of parameter lists
+            
+        Returns:
+            List of count parameter lists as compact JSON
+        """
+        options = self._sampled_params.get(method)
+        if options is None:
+            return [json_utils.dumps(params) for params in self.generate_batch(method, count)]
+        serialized_options = [[json_utils.dumps(option) for option in choices] for choices in options]
+        return [
+            b"[" + b",".join(params) + b"]"
+            for params in zip(*(random.choices(choices, k=count) for choices in serialized_options))
+        ]
+    
+    def get_available_methods(self) -> Dict[str, Callable[[], List[Any]]]:
+        """
+        Returns a dictionary of available methods and their parameter generators
+        
+        The dictionary is built once per generator and shared by all callers.
+        """
+        return self._methods
+    
     # Parameter generators for each method
     def _generate_no_params(self) -> List[Any]:
-        """Generate empty parameters for methods that don't require any"""
-        return []
+        """Generate empty parameters for methods that don't require any, the list is shared"""
+        return _NO_PARAMS
     
     def _generate_web3_sha3_params(self) -> List[Any]:
         """Generate parameters for web3_sha3"""
@@ -240,7 +411,7 @@ class ParameterGenerator:
         else:
             # Generate random data
             data_length = random.randint(2, 100)  # Length in bytes
-            random_data = "0x" + "".join(random.choice("0123456789abcdef") for _ in range(data_length * 2))
+            random_data = _random_hex(data_length)
             return [random_data]
     
     def _generate_eth_getBalance_params(self) -> List[Any]:
@@ -252,10 +423,29 @@ class ParameterGenerator:
     def _generate_eth_getStorageAt_params(self) -> List[Any]:
         """Generate parameters for eth_getStorageAt"""
         address = random.choice(self.sample_addresses)
-        position = "0x" + "".join(random.choice("0123456789abcdef") for _ in range(64))
+        position = _random_hex(32)
         block = random.choice(self.sample_block_numbers)
         return [address, position, block]
     
+    def _generate_eth_getStorageAt_batch(self, count: int) -> List[List[Any]]:
+        """
+        Generate the parameters for many eth_getStorageAt calls at once
+        
+        Args:
+            count: Number of parameter lists
+            
+        Returns:
+            List of count parameter lists
+        """
+        return [
+            [address, position, block]
+            for address, position, block in zip(
+                random.choices(self.sample_addresses, k=count),
+                _random_hex_list(32, count),
+                random.choices(self.sample_block_numbers, k=count),
+            )
+        ]
+    
     def _generate_eth_getTransactionCount_params(self) -> List[Any]:
         """Generate parameters for eth_getTransactionCount"""
         address = random.choice(self.sample_addresses)
@@ -288,57 +478,65 @@ class ParameterGenerator:
         block = random.choice(self.sample_block_numbers)
         return [address, block]
     
+    def _random_tx_object(self, include_data: bool, edge_case_data: bool) -> Dict[str, str]:
+        """
+        Generate the addresses and data shared by the eth_call and eth_estimateGas transactions
+        
+        Args:
+            include_data: Whether to include call data
+            edge_case_data: Whether the data is an edge case sample rather than random bytes
+            
+        Returns:
+            Transaction object with to, from and possibly data
+        """
+        tx_object = {"to": random.choice(self.sample_addresses), "from": random.choice(self.sample_addresses)}
+        if include_data:
+            if edge_case_data:
+                tx_object["data"] = random.choice(self.sample_data)
+            else:
+                data_length = random.randint(2, 100)  # Length in bytes
+                tx_object["data"] = _random_hex(data_length)
+        return tx_object
+    
     def _generate_eth_call_params(self) -> List[Any]:
         """Generate parameters for eth_call"""
-        # Generate a random transaction object
-        to_address = random.choice(self.sample_addresses)
-        from_address = random.choice(self.sample_addresses)
+        # The optional fields are decided by one random byte each, all drawn at once,
+        # a field is included if its byte is below probability * 256
+        flips = random.getrandbits(32)
         
-        # Sometimes include data, sometimes not
-        if random.random() < 0.5:
-            data_length = random.randint(2, 100)  # Length in bytes
-            data = "0x" + "".join(random.choice("0123456789abcdef") for _ in range(data_length * 2))
-            tx_object = {"to": to_address, "from": from_address, "data": data}
-        else:
-            tx_object = {"to": to_address, "from": from_address}
+        # Generate a random transaction object, sometimes with data, sometimes not
+        tx_object = self._random_tx_object(flips & 0xFF < 128, False)  # 50%
         
         # Sometimes include gas, gasPrice, value
-        if random.random() < 0.3:
-            tx_object["gas"] = "0x" + hex(random.randint(21000, 1000000))[2:]
-        if random.random() < 0.3:
-            tx_object["gasPrice"] = "0x" + hex(random.randint(1, 100) * 10**9)[2:]
-        if random.random() < 0.3:
-            tx_object["value"] = "0x" + hex(random.randint(0, 10) * 10**18)[2:]
+        if (flips >> 8) & 0xFF < 77:  # ~30%
+            tx_object["gas"] = f"0x{random.randint(*_CALL_GAS_RANGE):x}"
+        if (flips >> 16) & 0xFF < 77:  # ~30%
+            tx_object["gasPrice"] = random.choice(_CALL_GAS_PRICES)
+        if (flips >> 24) < 77:  # ~30%
+            tx_object["value"] = random.choice(_CALL_VALUES)
         
         block = random.choice(self.sample_block_numbers)
         return [tx_object, block]
     
     def _generate_eth_estimateGas_params(self) -> List[Any]:
         """Generate parameters for eth_estimateGas"""
-        # Similar to eth_call but without the block parameter
-        to_address = random.choice(self.sample_addresses)
-        from_address = random.choice(self.sample_addresses)
-        
-        # Generate a transaction object with higher probability of edge cases
-        tx_object = {"to": to_address, "from": from_address}
+        # Similar to eth_call but without the block parameter, and with higher
+        # probability of edge cases. The random choices are decided by one random
+        # byte each, all drawn at once, a choice is taken if its byte is below
+        # probability * 256
+        flips = random.getrandbits(40)
         
-        # Sometimes include data with higher chance of edge cases
-        if random.random() < 0.7:  # 70% chance to include data
-            if random.random() < 0.4:  # 40% chance to use edge case data
-                tx_object["data"] = random.choice(self.sample_data) 
-            else:
-                data_length = random.randint(2, 100)
-                data = "0x" + "".join(random.choice("0123456789abcdef") for _ in range(data_length * 2))
-                tx_object["data"] = data
+        # ~70% chance to include data, ~40% of that edge case data
+        tx_object = self._random_tx_object(flips & 0xFF < 179, (flips >> 8) & 0xFF < 102)
         
         # Include gas, gasPrice, value with higher probability and edge cases
-        if random.random() < 0.5:  # 50% chance to include gas
+        if (flips >> 16) & 0xFF < 128:  # 50% chance to include gas
             tx_object["gas"] = random.choice(self.sample_gas_limits)
             
-        if random.random() < 0.5:  # 50% chance to include gasPrice
+        if (flips >> 24) & 0xFF < 128:  # 50% chance to include gasPrice
             tx_object["gasPrice"] = random.choice(self.sample_gas_prices)
             
-        if random.random() < 0.5:  # 50% chance to include value
+        if (flips >> 32) < 128:  # 50% chance to include value
             tx_object["value"] = random.choice(self.sample_values)
         
         return [tx_object]
@@ -346,13 +544,13 @@ class ParameterGenerator:
     def _generate_eth_getBlockByHash_params(self) -> List[Any]:
         """Generate parameters for eth_getBlockByHash"""
         block_hash = random.choice(self.sample_block_hashes)
-        full_tx = random.choice([True, False])
+        full_tx = bool(random.getrandbits(1))
         return [block_hash, full_tx]
     
     def _generate_eth_getBlockByNumber_params(self) -> List[Any]:
         """Generate parameters for eth_getBlockByNumber"""
         block = random.choice(self.sample_block_numbers)
-        full_tx = random.choice([True, False])
+        full_tx = bool(random.getrandbits(1))
         return [block, full_tx]
     
     def _generate_eth_getTransactionByHash_params(self) -> List[Any]:
@@ -363,13 +561,13 @@ class ParameterGenerator:
     def _generate_eth_getTransactionByBlockHashAndIndex_params(self) -> List[Any]:
         """Generate parameters for eth_getTransactionByBlockHashAndIndex"""
         block_hash = random.choice(self.sample_block_hashes)
-        tx_index = "0x" + hex(random.randint(0, 500))[2:]
+        tx_index = random.choice(_TX_INDICES)
         return [block_hash, tx_index]
     
     def _generate_eth_getTransactionByBlockNumberAndIndex_params(self) -> List[Any]:
         """Generate parameters for eth_getTransactionByBlockNumberAndIndex"""
         block = random.choice(self.sample_block_numbers)
-        tx_index = "0x" + hex(random.randint(0, 500))[2:]
+        tx_index = random.choice(_TX_INDICES)
         return [block, tx_index]
     
     def _generate_eth_getTransactionReceipt_params(self) -> List[Any]:
@@ -380,41 +578,45 @@ class ParameterGenerator:
     def _generate_eth_getUncleByBlockHashAndIndex_params(self) -> List[Any]:
         """Generate parameters for eth_getUncleByBlockHashAndIndex"""
         block_hash = random.choice(self.sample_block_hashes)
-        uncle_index = "0x" + hex(random.randint(0, 10))[2:]
+        uncle_index = random.choice(_UNCLE_INDICES)
         return [block_hash, uncle_index]
     
     def _generate_eth_getUncleByBlockNumberAndIndex_params(self) -> List[Any]:
         """Generate parameters for eth_getUncleByBlockNumberAndIndex"""
         block = random.choice(self.sample_block_numbers)
-        uncle_index = "0x" + hex(random.randint(0, 10))[2:]
+        uncle_index = random.choice(_UNCLE_INDICES)
         return [block, uncle_index]
     
     def _generate_eth_newFilter_params(self) -> List[Any]:
         """Generate parameters for eth_newFilter"""
+        # Local names for the random functions, which are called many times below
+        choice, randint = random.choice, random.randint
+        
         filter_obj = {}
         
+        # The random choices are decided by one random byte each, all drawn at once,
+        # a choice is taken if its byte is below probability * 256. The two bits
+        # above them give the number of topics.
+        flips = random.getrandbits(42)
+        
         # Randomly include fromBlock, toBlock, address, topics
-        if random.random() < 0.7:
-            filter_obj["fromBlock"] = random.choice(self.sample_block_numbers)
-        if random.random() < 0.7:
-            filter_obj["toBlock"] = random.choice(self.sample_block_numbers)
+        if flips & 0xFF < 179:  # ~70%
+            filter_obj["fromBlock"] = choice(self.sample_block_numbers)
+        if (flips >> 8) & 0xFF < 179:  # ~70%
+            filter_obj["toBlock"] = choice(self.sample_block_numbers)
         
         # Address can be a single address or an array of addresses
-        if random.random() < 0.7:
-            if random.random() < 0.5:
-                filter_obj["address"] = random.choice(self.sample_addresses)
+        if (flips >> 16) & 0xFF < 179:  # ~70%
+            if (flips >> 24) & 0xFF < 128:  # 50%
+                filter_obj["address"] = choice(self.sample_addresses)
             else:
-                num_addresses = random.randint(1, 3)
-                filter_obj["address"] = random.sample(self.sample_addresses, num_addresses)
+                num_addresses = randint(1, 3)
+                filter_obj["address"] = list(choice(self._address_selections[num_addresses]))
         
         # Topics can be complex, but we'll keep it simple for fuzzing
-        if random.random() < 0.5:
-            num_topics = random.randint(1, 4)
-            topics = []
-            for _ in range(num_topics):
-                topic = "0x" + "".join(random.choice("0123456789abcdef") for _ in range(64))
-                topics.append(topic)
-            filter_obj["topics"] = topics
+        if (flips >> 32) & 0xFF < 128:  # 50%
+            num_topics = (flips >> 40) + 1  # 1 to 4
+            filter_obj["topics"] = _random_hex_list(32, num_topics)
         
         return [filter_obj]
     
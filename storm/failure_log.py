@@ -0,0 +1,117 @@
+"""
+Failed request log for Storm
+"""
+
+import asyncio
+import collections
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Union
+
+from . import json_utils
+
+class FailureLog:
+    """
+    Appends failed requests to a log file without blocking the event loop
+    
+    Entries are buffered in memory and written in batches from a single
+    writer thread, through one long-lived file handle. Each entry is one
+    line in the format of the log header, with the request and error as
+    compact JSON, so serialized requests are written as they were sent.
+    """
+    
+    def __init__(self, path: str, flush_interval: float = 0.1, batch_size: int = 256, max_entries: int = 10000):
+        """
+        Initialize the failure log
+        
+        Args:
+            path: Log file to append to
+            flush_interval: Seconds between writes
+            batch_size: Maximum number of entries per write
+            max_entries: Maximum number of buffered entries, older ones are dropped
+        """
+        self.path = path
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._entries = collections.deque(maxlen=max_entries)
+        self._dropped = 0
+        self._file = None
+        # One thread, so batches are written in order and never concurrently
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._drain_task: Optional[asyncio.Task] = None
+    
+    def write(self, method: str, request: Union[Dict, bytes], error: Any):
+        """
+        Buffer a failed request, formatting is deferred to the writer
+        
+        Args:
+            method: The method that failed
+            request: The request that was sent, either as a dict or its serialized body
+            error: The error response or exception
+        """
+        if len(self._entries) == self._entries.maxlen:
+            self._dropped += 1
+        self._entries.append((time.time(), method, request, error))
+    
+    def start(self):
+        """Start writing buffered entries in the background"""
+        if self._drain_task is None:
+            self._drain_task = asyncio.ensure_future(self._drain())
+    
+    async def stop(self):
+        """Stop the background writer, write what is left and close the file"""
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            try:
+                await self._drain_task
+            except asyncio.CancelledError:
+                pass
+            self._drain_task = None
+        loop = asyncio.get_running_loop()
+        while self._entries or self._dropped:
+            await loop.run_in_executor(self._executor, self._write_batch, self._take_batch())
+        await loop.run_in_executor(self._executor, self._close_file)
+    
+    async def _drain(self):
+        """Write buffered entries once per flush interval"""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            while self._entries:
+                await loop.run_in_executor(self._executor, self._write_batch, self._take_batch())
+    
+    def _close_file(self):
+        """Close the log file, runs in the writer thread"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def _take_batch(self) -> list:
+        """Remove up to batch_size entries from the buffer, preceded by the dropped count if any"""
+        count = min(self.batch_size, len(self._entries))
+        batch = [self._entries.popleft() for _ in range(count)]
+        if self._dropped:
+            batch.insert(0, self._dropped)
+            self._dropped = 0
+        return batch
+    
+    def _write_batch(self, entries: list):
+        """Format entries and append them to the log file in a single write, runs in a worker thread"""
+        parts = []
+        if entries and isinstance(entries[0], int):
+            parts.append(f"# {entries[0]} failed requests not logged, the log buffer was full\n")
+            entries = entries[1:]
+        # Entries of a batch mostly share the same second, format its timestamp only once
+        second = None
+        formatted = ""
+        for timestamp, method, request, error in entries:
+            if int(timestamp) != second:
+                second = int(timestamp)
+                formatted = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+            request = request.decode(errors="replace") if isinstance(request, bytes) else json_utils.dumps_text(request)
+            error = json_utils.dumps_text(error) if isinstance(error, dict) else str(error).replace("\n", "\\n")
+            parts.append(f"[{formatted}] {method} | {request} | {error}\n")
+        if self._file is None:
+            self._file = open(self.path, "a")
+        self._file.write("".join(parts))
+        self._file.flush()
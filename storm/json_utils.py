@@ -0,0 +1,58 @@
+"""
+JSON serialization helpers for Storm
+
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise. Decode errors raised by either backend are
+subclasses of json.JSONDecodeError.
+"""
+
+import json
+from typing import Any
+
+from multidict import CIMultiDict, CIMultiDictProxy
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Headers for requests whose body is already serialized JSON. aiohttp copies
+# a plain dict into a new CIMultiDict on every request, a multidict is used as is.
+JSON_HEADERS = CIMultiDictProxy(CIMultiDict({"Content-Type": "application/json"}))
+
+if orjson is not None:
+    def dumps(obj: Any) -> bytes:
+        """Serialize an object to compact JSON bytes"""
+        return orjson.dumps(obj)
+
+    def dumps_text(obj: Any) -> str:
+        """Serialize an object to compact JSON text"""
+        return orjson.dumps(obj).decode()
+
+    loads = orjson.loads
+else:
+    def dumps(obj: Any) -> bytes:
+        """Serialize an object to compact JSON bytes"""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def dumps_text(obj: Any) -> str:
+        """Serialize an object to compact JSON text"""
+        return json.dumps(obj, separators=(",", ":"))
+
+    loads = json.loads
+
+
+def is_result_object(body: bytes) -> bool:
+    """
+    Check with a byte scan whether a response body is a JSON object without an error
+
+    The body is not parsed, so a malformed body that looks like an object
+    passes. Callers parse the body themselves when the check fails.
+
+    Args:
+        body: Raw response body
+
+    Returns:
+        True if the body is an object that does not mention "error"
+    """
+    return body.startswith(b"{") and body.rstrip().endswith(b"}") and b'"error"' not in body
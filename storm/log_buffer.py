@@ -0,0 +1,72 @@
+"""
+Buffered verbose output for Storm
+"""
+
+import asyncio
+import collections
+import sys
+from typing import Optional, Union
+
+class LogBuffer:
+    """
+    Collects verbose messages and prints them in one write per interval
+    
+    Printing from every request callback costs a write() per line at high
+    request rates, the buffer turns that into one write per flush. Messages
+    can be raw bytes, such as serialized requests and responses, which are
+    only decoded when they are printed.
+    """
+    
+    def __init__(self, interval: float = 1.0, max_messages: int = 10000):
+        """
+        Initialize the log buffer
+        
+        Args:
+            interval: Seconds between flushes
+            max_messages: Maximum number of buffered messages, older ones are dropped
+        """
+        self.interval = interval
+        self._messages = collections.deque(maxlen=max_messages)
+        self._dropped = 0
+        self._flush_task: Optional[asyncio.Task] = None
+    
+    def write(self, message: Union[str, bytes]):
+        """Buffer a message for the next flush"""
+        if len(self._messages) == self._messages.maxlen:
+            self._dropped += 1
+        self._messages.append(message)
+    
+    def flush(self):
+        """Print all buffered messages at once"""
+        if not self._messages:
+            return
+        lines = list(self._messages)
+        self._messages.clear()
+        if self._dropped:
+            lines.insert(0, f"... {self._dropped} older messages dropped")
+            self._dropped = 0
+        text = "\n".join(line if isinstance(line, str) else line.decode(errors="replace") for line in lines)
+        sys.stdout.write("\n" + text + "\n")
+        sys.stdout.flush()
+    
+    def start(self):
+        """Start flushing the buffer periodically"""
+        if self._flush_task is None:
+            self._flush_task = asyncio.ensure_future(self._flush_periodically())
+    
+    async def stop(self):
+        """Stop periodic flushing and print whatever is left"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        self.flush()
+    
+    async def _flush_periodically(self):
+        """Flush the buffer once per interval"""
+        while True:
+            await asyncio.sleep(self.interval)
+            self.flush()
@@ -0,0 +1,61 @@
+"""
+Progress output for Storm
+"""
+
+import asyncio
+import sys
+import time
+from typing import Any, Dict, Optional
+
+class ProgressTicker:
+    """
+    Prints the progress of a test run once per interval from its own task
+    
+    The request path never touches the progress output, the ticker only
+    reads the request counter from the stats when it wakes up.
+    """
+    
+    def __init__(self, duration: int, stats: Dict[str, Any], interval: float = 1.0):
+        """
+        Initialize the progress ticker
+        
+        Args:
+            duration: Duration of the test in seconds
+            stats: Statistics of the running test, read for the request count
+            interval: Seconds between updates
+        """
+        self.duration = duration
+        self.stats = stats
+        self.interval = interval
+        self._started_at = 0.0
+        self._tick_task: Optional[asyncio.Task] = None
+    
+    def print_progress(self):
+        """Print the current progress over the previous progress line"""
+        elapsed = min(self.duration, int(time.time() - self._started_at))
+        sys.stdout.write(f"\rTesting progress: {elapsed}/{self.duration}s, {self.stats['total_requests']} requests")
+        sys.stdout.flush()
+    
+    def start(self):
+        """Start printing the progress periodically"""
+        if self._tick_task is None:
+            self._started_at = time.time()
+            self._tick_task = asyncio.ensure_future(self._tick())
+    
+    async def stop(self):
+        """Stop the periodic updates and print the final progress"""
+        if self._tick_task is not None:
+            self._tick_task.cancel()
+            try:
+                await self._tick_task
+            except asyncio.CancelledError:
+                pass
+            self._tick_task = None
+            self.print_progress()
+            sys.stdout.write("\n")
+    
+    async def _tick(self):
+        """Print the progress once per interval"""
+        while True:
+            await asyncio.sleep(self.interval)
+            self.print_progress()
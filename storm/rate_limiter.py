@@ -0,0 +1,116 @@
+"""
+Rate limiting for Storm
+"""
+
+import asyncio
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+class TokenBucket:
+    """
+    Token bucket that paces requests to a fixed rate
+    
+    A single background task refills the bucket on a short fixed tick, so the
+    number of timer wakeups per second does not grow with the request rate.
+    Tokens are a plain counter, taking any number of them is one step, and
+    waiting callers are served in order when the bucket is refilled.
+    """
+    
+    # The bucket is checked once per batch of requests, slots make those lookups direct
+    __slots__ = ("rate", "burst", "tick", "_level", "_waiters", "_refill_task")
+    
+    def __init__(self, rate: int, burst: Optional[int] = None, tick: float = 0.01):
+        """
+        Initialize the token bucket
+        
+        Args:
+            rate: Number of tokens added per second
+            burst: Maximum number of tokens the bucket can hold (default: rate)
+            tick: Interval between refills in seconds
+        """
+        self.rate = max(1, rate)
+        self.burst = max(1, burst if burst is not None else self.rate)
+        self.tick = tick
+        # Tokens in the bucket, negative while a request larger than the burst is paid off
+        self._level = 0
+        # Callers waiting for tokens, as (tokens, future), in arrival order
+        self._waiters: Deque[Tuple[int, asyncio.Future]] = deque()
+        self._refill_task: Optional[asyncio.Task] = None
+    
+    async def __aenter__(self) -> "TokenBucket":
+        self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+    
+    def start(self):
+        """Start refilling the bucket, it starts out empty"""
+        if self._refill_task is None:
+            self._refill_task = asyncio.ensure_future(self._refill())
+    
+    async def stop(self):
+        """Stop refilling the bucket"""
+        if self._refill_task is not None:
+            self._refill_task.cancel()
+            try:
+                await self._refill_task
+            except asyncio.CancelledError:
+                pass
+            self._refill_task = None
+    
+    async def acquire(self, tokens: int = 1):
+        """
+        Wait until the given number of tokens is available and take them
+        
+        Args:
+            tokens: Number of tokens to take
+        """
+        if not self._waiters and self._level >= min(tokens, self.burst):
+            self._level -= tokens
+            return
+        
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append((tokens, waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The tokens were already taken for this caller, put them back
+                self._level = min(self.burst, self._level + tokens)
+            elif (tokens, waiter) in self._waiters:
+                self._waiters.remove((tokens, waiter))
+            self._wake_waiters()
+            raise
+    
+    def _wake_waiters(self):
+        """Hand out tokens to the waiting callers in order, while there are enough"""
+        waiters = self._waiters
+        while waiters:
+            tokens, waiter = waiters[0]
+            if waiter.done():
+                waiters.popleft()
+                continue
+            # A request larger than the burst is let through once the bucket is full
+            if self._level < min(tokens, self.burst):
+                break
+            waiters.popleft()
+            self._level -= tokens
+            waiter.set_result(None)
+    
+    async def _refill(self):
+        """Add tokens for the elapsed time on every tick, up to the burst size"""
+        loop = asyncio.get_running_loop()
+        last = loop.time()
+        pending = 0.0
+        while True:
+            await asyncio.sleep(self.tick)
+            now = loop.time()
+            pending += (now - last) * self.rate
+            last = now
+            
+            whole = int(pending)
+            pending -= whole
+            # Tokens that do not fit into the bucket are dropped
+            self._level = min(self.burst, self._level + whole)
+            self._wake_waiters()
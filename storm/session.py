@@ -0,0 +1,130 @@
+"""
+HTTP session setup for Storm
+"""
+
+import contextlib
+from typing import Any, AsyncIterator, Dict, Optional
+
+import aiohttp
+
+from . import json_utils
+
+try:
+    import httpx
+except ImportError:
+    # httpx (with the h2 extra) is only needed for HTTP/2 sessions
+    httpx = None
+
+def _connection_limit(requests_per_second: int) -> int:
+    """Connection pool size for a target request rate"""
+    return max(1024, requests_per_second * 4)
+
+def create_session(requests_per_second: int = 100) -> aiohttp.ClientSession:
+    """
+    Create a keep-alive aiohttp session to be used for a whole test run
+    
+    The connector limits scale with the request rate: aiohttp's default of
+    100 connections becomes the bottleneck well before the target node does.
+    The target host is resolved once and the result pinned for the whole run,
+    so new connections never go back to getaddrinfo in the thread pool.
+    Requests passing json= are serialized with the same backend as the
+    pre-serialized request bodies.
+    
+    Args:
+        requests_per_second: Target request rate of the run
+        
+    Returns:
+        A new session, to be closed by the caller
+    """
+    limit = _connection_limit(requests_per_second)
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit,
+        use_dns_cache=True,
+        ttl_dns_cache=None,
+        keepalive_timeout=75,
+        enable_cleanup_closed=True,
+    )
+    # No total timeout: a slow node should show up as slow requests, not as a cap on them
+    timeout = aiohttp.ClientTimeout(total=None, connect=5, sock_read=10)
+    return aiohttp.ClientSession(connector=connector, timeout=timeout, json_serialize=json_utils.dumps_text)
+
+class HTTP2Response:
+    """
+    Response of an HTTP2Session request, with the parts of aiohttp's response API the testers use
+    """
+    
+    def __init__(self, response: "httpx.Response"):
+        self._response = response
+        self.status = response.status_code
+    
+    async def read(self) -> bytes:
+        """Return the response body"""
+        return self._response.content
+    
+    async def text(self) -> str:
+        """Return the response body decoded to text"""
+        return self._response.text
+
+class HTTP2Session:
+    """
+    HTTP/2 session backed by httpx, usable in place of an aiohttp.ClientSession by the testers
+    
+    Many concurrent requests are multiplexed as streams over a few
+    connections. HTTP/2 is negotiated over TLS, so plain http:// endpoints
+    keep using HTTP/1.1.
+    """
+    
+    def __init__(self, client: "httpx.AsyncClient"):
+        self._client = client
+    
+    async def __aenter__(self) -> "HTTP2Session":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    @property
+    def closed(self) -> bool:
+        return self._client.is_closed
+    
+    @contextlib.asynccontextmanager
+    async def post(self, url: str, data: Optional[bytes] = None, json: Any = None,
+                   headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None) -> AsyncIterator[HTTP2Response]:
+        """Send a POST request, with the same arguments as aiohttp's ClientSession.post"""
+        if json is not None:
+            data = json_utils.dumps(json)
+            headers = {**json_utils.JSON_HEADERS, **(headers or {})}
+        kwargs = {"timeout": timeout} if timeout is not None else {}
+        yield HTTP2Response(await self._client.post(url, content=data, headers=headers, **kwargs))
+    
+    @contextlib.asynccontextmanager
+    async def get(self, url: str, timeout: Optional[float] = None) -> AsyncIterator[HTTP2Response]:
+        """Send a GET request"""
+        kwargs = {"timeout": timeout} if timeout is not None else {}
+        yield HTTP2Response(await self._client.get(url, **kwargs))
+    
+    async def close(self):
+        """Close the underlying client"""
+        await self._client.aclose()
+
+def create_http2_session(requests_per_second: int = 100) -> HTTP2Session:
+    """
+    Create an HTTP/2 session to be used for a whole test run
+    
+    Args:
+        requests_per_second: Target request rate of the run
+        
+    Returns:
+        A new session, to be closed by the caller
+    """
+    if httpx is None:
+        raise RuntimeError("HTTP/2 support requires httpx, install it with: pip install 'httpx[http2]'")
+    
+    limit = _connection_limit(requests_per_second)
+    client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=limit, max_keepalive_connections=limit, keepalive_expiry=75),
+        timeout=httpx.Timeout(10.0, connect=5.0),
+    )
+    return HTTP2Session(client)